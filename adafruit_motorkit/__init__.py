@@ -0,0 +1,1342 @@
+# SPDX-FileCopyrightText: 2017 Scott Shawcroft for Adafruit Industries
+# SPDX-FileCopyrightText: 2018 Kattni Rembor for Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_motorkit`
+====================================================
+
+CircuitPython helper library for DC & Stepper Motor FeatherWing, Shield, and Pi Hat kits.
+
+* Author(s): Scott Shawcroft, Kattni Rembor
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `DC Motor + Stepper FeatherWing <https://www.adafruit.com/product/2927>`_
+* `Adafruit Motor/Stepper/Servo Shield for Arduino v2 Kit <https://www.adafruit.com/product/1438>`_
+* `Adafruit DC & Stepper Motor HAT for Raspberry Pi - Mini Kit
+  <https://www.adafruit.com/product/2348>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+ * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+ * Adafruit's Register library: https://github.com/adafruit/Adafruit_CircuitPython_Register
+ * Adafruit's PCA9685 library: https://github.com/adafruit/Adafruit_CircuitPython_PCA9685
+ * Adafruit's Motor library: https://github.com/adafruit/Adafruit_CircuitPython_Motor
+
+"""
+
+import math
+import time
+
+from micropython import const
+
+try:
+    from types import TracebackType
+    from typing import Optional, Tuple, Type
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_MotorKit.git"
+
+_LED0_ON_L = const(0x06)
+
+# Bytes of bus time each I2C write costs on top of its data, by default: the address and first
+# register bytes, the START and STOP conditions, and the time Python and the driver take to start
+# a write, which on a Raspberry Pi is a few hundred microseconds, about a dozen bytes at 400 kHz.
+_WRITE_OVERHEAD = const(16)
+
+TRAPEZOIDAL = const(0)
+"""Acceleration profile that speeds up and slows down at a constant rate"""
+S_CURVE = const(1)
+"""Acceleration profile that eases in and out of its constant speed, which is gentler on the
+   motor and the load than `TRAPEZOIDAL` for the same peak acceleration"""
+
+# Values match the constants in adafruit_motor.stepper so either set can be passed in.
+_FORWARD = const(1)
+_BACKWARD = const(2)
+_SINGLE = const(1)
+_DOUBLE = const(2)
+_INTERLEAVE = const(3)
+_MICROSTEP = const(4)
+
+# Values match the constants in adafruit_motor.motor.
+_FAST_DECAY = const(0)
+_SLOW_DECAY = const(1)
+
+_RELEASED = b"\x00\x00\x00\x10" * 4
+
+# The PCA9685 channels of the M1 to M4 terminals: (enable, positive input, negative input).
+# stepper1 uses M1 and M2, stepper2 uses M3 and M4.
+_WIRING = ((8, 9, 10), (13, 11, 12), (2, 3, 4), (7, 5, 6))
+
+# Coil register frames shared by every stepper, keyed by (microsteps, microstepping).
+_STEP_FRAMES = {}
+
+
+def _encode(value: int, regs: bytearray, offset: int) -> None:
+    # Same register encoding as adafruit_pca9685.PWMChannel, except that full on and full off
+    # only change the bits they need and keep the rest of the channel's bytes. Full off takes
+    # priority over full on, so a channel that has been fully on keeps its full on bit, and
+    # switching between the two then changes just the full off bit in LEDn_OFF_H.
+    if not 0 <= value <= 0xFFFF:
+        raise ValueError(f"Out of range: value {value} not 0 <= value <= 65,535")
+    if value == 0xFFFF:
+        regs[offset + 1] |= 0x10
+        regs[offset + 3] &= 0xEF
+    elif value < 0x0010:
+        regs[offset + 3] |= 0x10
+    else:
+        value >>= 4
+        regs[offset] = 0
+        regs[offset + 1] = 0
+        regs[offset + 2] = value & 0xFF
+        regs[offset + 3] = value >> 8
+
+
+def _decode(regs: bytearray, offset: int) -> int:
+    # The 16 bit duty cycle of a channel's registers, the inverse of _encode. Full off takes
+    # priority over full on, as on the PCA9685.
+    if regs[offset + 3] & 0x10:
+        return 0
+    if regs[offset + 1] & 0x10:
+        return 0xFFFF
+    on = regs[offset] | (regs[offset + 1] & 0x0F) << 8
+    return (((regs[offset + 2] | (regs[offset + 3] & 0x0F) << 8) - on) & 0xFFF) << 4
+
+
+def _load_frame(regs: bytearray, offset: int, frame: bytes) -> int:
+    # Loads a 16 byte frame of four channels into regs at offset, encoding each channel as
+    # _encode does, and returns a bit for each channel whose bytes changed.
+    changed = 0
+    for i in range(4):
+        channel = offset + 4 * i
+        if frame[4 * i + 3] & 0x10:
+            if regs[channel + 3] & 0x10:
+                continue
+            regs[channel + 3] |= 0x10
+        elif frame[4 * i + 1] & 0x10:
+            if regs[channel + 1] & 0x10 and not regs[channel + 3] & 0x10:
+                continue
+            regs[channel + 1] |= 0x10
+            regs[channel + 3] &= 0xEF
+        else:
+            if regs[channel : channel + 4] == frame[4 * i : 4 * i + 4]:
+                continue
+            regs[channel : channel + 4] = frame[4 * i : 4 * i + 4]
+        changed |= 1 << i
+    return changed
+
+
+def _span(channels) -> int:
+    # Mask of every channel from the lowest to the highest of channels.
+    return ((1 << (max(channels) + 1)) - 1) ^ ((1 << min(channels)) - 1)
+
+
+def _step_frames(microsteps: int, microstepping: bool) -> bytes:
+    """Returns the register frames for every microstep position in one electrical cycle. Each
+    frame is 16 bytes: the LEDn registers of the four coil channels in channel order."""
+    key = (microsteps, microstepping)
+    frames = _STEP_FRAMES.get(key)
+    if frames is None:
+        curve = [
+            int(round(0xFFFF * math.sin(math.pi / (2 * microsteps) * i)))
+            for i in range(microsteps + 1)
+        ]
+        frames = bytearray(64 * microsteps)
+        duty_cycles = [0, 0, 0, 0]
+        for position in range(4 * microsteps):
+            # Identical to adafruit_motor.stepper.StepperMotor._update_coils.
+            duty_cycles[0] = duty_cycles[1] = duty_cycles[2] = duty_cycles[3] = 0
+            trailing_coil = (position // microsteps) % 4
+            leading_coil = (trailing_coil + 1) % 4
+            microstep = position % microsteps
+            duty_cycles[leading_coil] = curve[microstep]
+            duty_cycles[trailing_coil] = curve[microsteps - microstep]
+            if not microstepping and (
+                duty_cycles[leading_coil] == duty_cycles[trailing_coil]
+                and duty_cycles[leading_coil] > 0
+            ):
+                duty_cycles[leading_coil] = 0xFFFF
+                duty_cycles[trailing_coil] = 0xFFFF
+            # The coils are ordered (ain2, bin1, ain1, bin2), which are channel offsets 0, 2, 1, 3.
+            offset = 16 * position
+            _encode(duty_cycles[0], frames, offset)
+            _encode(duty_cycles[2], frames, offset + 4)
+            _encode(duty_cycles[1], frames, offset + 8)
+            _encode(duty_cycles[3], frames, offset + 12)
+        frames = bytes(frames)
+        _STEP_FRAMES[key] = frames
+    return frames
+
+
+def _deadlines(count: int, rate: Optional[float], ramp: Optional["array.array"]):
+    """Yields the `time.monotonic_ns` deadline of every step after the first of ``count`` steps,
+    accelerating along ``ramp`` if given. The first step is taken at the time of the first call."""
+    if not rate:
+        for _ in range(count - 1):
+            yield 0
+        return
+    interval = int(1_000_000_000 / rate)
+    deadline = time.monotonic_ns()
+    if ramp is None:
+        for _ in range(count - 1):
+            deadline += interval
+            yield deadline
+        return
+    length = len(ramp)
+    last = count - 2
+    for i in range(count - 1):
+        position = min(i, last - i)
+        deadline += ramp[position] if position < length else interval
+        yield deadline
+
+
+class _Batch:
+    """Context manager returned by `MotorKit.batch`."""
+
+    __slots__ = ("_kit",)
+
+    def __init__(self, kit: "MotorKit") -> None:
+        self._kit = kit
+
+    def __enter__(self) -> "MotorKit":
+        kit = self._kit
+        if kit._lock is not None:
+            kit._lock.acquire()
+        kit._batch_depth += 1
+        return kit
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[type]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        kit = self._kit
+        try:
+            kit._batch_depth -= 1
+            if not kit._batch_depth:
+                kit._flush()
+        finally:
+            if kit._lock is not None:
+                kit._lock.release()
+
+
+class _DCMotor:
+    """A `adafruit_motor.motor.DCMotor` compatible motor that updates both of its inputs in one
+    I2C transaction.
+
+    :param MotorKit kit: The kit that owns the motor
+    :param int positive: The channel that causes the motor to spin forwards when high
+    :param int negative: The channel that causes the motor to spin backwards when high
+    """
+
+    __slots__ = ("_decay_mode", "_kit", "_negative", "_positive", "_throttle")
+
+    def __init__(self, kit: "MotorKit", positive: int, negative: int) -> None:
+        self._kit = kit
+        self._positive = positive
+        self._negative = negative
+        self._throttle = None
+        self._decay_mode = _FAST_DECAY
+        bits = 1 << positive | 1 << negative
+        if kit._valid & bits == bits:
+            self._adopt(_decode(kit._regs, 4 * positive + 1), _decode(kit._regs, 4 * negative + 1))
+
+    def _adopt(self, positive: int, negative: int) -> None:
+        # Takes the throttle and decay mode from the inputs' current duty cycles, the inverse of
+        # the throttle setter.
+        if positive == negative:
+            self._throttle = 0 if positive == 0xFFFF else None
+        elif negative == 0:
+            self._throttle = positive / 0xFFFF
+        elif positive == 0:
+            self._throttle = -negative / 0xFFFF
+        elif positive == 0xFFFF:
+            self._throttle = (0xFFFF - negative) / 0xFFFF
+            self._decay_mode = _SLOW_DECAY
+        elif negative == 0xFFFF:
+            self._throttle = -(0xFFFF - positive) / 0xFFFF
+            self._decay_mode = _SLOW_DECAY
+
+    @property
+    def throttle(self) -> Optional[float]:
+        """Motor speed, ranging from -1.0 (full speed reverse) to 1.0 (full speed forward),
+        or ``None`` (controller off).
+        If ``None``, both PWMs are turned full off. If ``0.0``, both PWMs are turned full on.
+        """
+        return self._throttle
+
+    @throttle.setter
+    def throttle(self, value: Optional[float]) -> None:
+        if value is not None and (value > 1.0 or value < -1.0):
+            raise ValueError("Throttle must be None or between -1.0 and +1.0")
+        self._throttle = value
+        if value is None:  # Turn off motor controller (high-Z)
+            positive = negative = 0
+        elif value == 0:  # Brake motor (low-Z)
+            positive = negative = 0xFFFF
+        else:
+            duty_cycle = int(0xFFFF * abs(value))
+            if self._decay_mode == _SLOW_DECAY:  # Slow Decay (Braking) Mode
+                if value < 0:
+                    positive, negative = 0xFFFF - duty_cycle, 0xFFFF
+                else:
+                    positive, negative = 0xFFFF, 0xFFFF - duty_cycle
+            elif value < 0:
+                positive, negative = 0, duty_cycle
+            else:
+                positive, negative = duty_cycle, 0
+        with self._kit._batcher:
+            self._kit._write(self._positive, positive, self)
+            self._kit._write(self._negative, negative, self)
+
+    @property
+    def decay_mode(self) -> int:
+        """Motor controller recirculation current decay mode. A value of ``motor.FAST_DECAY``
+        sets the motor controller to the default fast recirculation current decay mode
+        (coasting); ``motor.SLOW_DECAY`` sets slow decay (braking) mode."""
+        return self._decay_mode
+
+    @decay_mode.setter
+    def decay_mode(self, mode: int = _FAST_DECAY) -> None:
+        if mode in {_FAST_DECAY, _SLOW_DECAY}:
+            self._decay_mode = mode
+        else:
+            raise ValueError("Decay mode value must be either motor.FAST_DECAY or motor.SLOW_DECAY")
+
+    def _ramp(self, target: float, seconds: float, rate: float):
+        if target is None or target > 1.0 or target < -1.0:
+            raise ValueError("Throttle must be between -1.0 and +1.0")
+        if seconds < 0:
+            raise ValueError("Duration must not be negative")
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        return self._ramping(target, seconds, rate)
+
+    def _ramping(self, target: float, seconds: float, rate: float):
+        start = self._throttle or 0.0
+        updates = max(1, int(seconds * rate))
+        interval = int(1_000_000_000 / rate)
+        deadline = time.monotonic_ns()
+        for i in range(1, updates):
+            self.throttle = start + (target - start) * i / updates
+            deadline += interval
+            yield deadline
+        self.throttle = target
+
+    async def ramp_async(self, target: float, seconds: float, *, rate: float = 50.0) -> None:
+        """Changes the throttle linearly from its current value to ``target`` over ``seconds``,
+        without blocking the event loop. Ramps on all of the kit's motors are driven by one
+        scheduler task that sends the updates that are due at the same time together.
+
+        :param float target: The final throttle, from -1.0 to 1.0
+        :param float seconds: How long the ramp takes
+        :param float rate: Throttle updates per second. Defaults to 50.
+        """
+        await self._kit._run_async(self._ramp(target, seconds, rate))
+
+    def __enter__(self) -> "_DCMotor":
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[type]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.throttle = None
+
+
+class _StepperMotor:
+    """A `adafruit_motor.stepper.StepperMotor` compatible stepper that writes each step as one
+    precomputed frame covering its four coil channels.
+
+    :param MotorKit kit: The kit that owns the stepper
+    :param int channel: The lowest of the four contiguous coil channels
+    :param int microsteps: Number of microsteps between full steps. Must be at least 2 and even.
+    """
+
+    __slots__ = ("_channel", "_current_microstep", "_kit", "_microsteps")
+
+    def __init__(self, kit: "MotorKit", channel: int, microsteps: int) -> None:
+        if microsteps < 2:
+            raise ValueError("Microsteps must be at least 2")
+        if microsteps % 2 == 1:
+            raise ValueError("Microsteps must be even")
+        self._kit = kit
+        self._channel = channel
+        self._microsteps = microsteps
+        self._current_microstep = 0
+        # Carry on from the coils' current position if it is known, otherwise move to position 0.
+        if kit._valid >> channel & 0xF == 0xF:
+            # Compared by duty cycle, as full on and full off can be encoded more than one way.
+            coils = [_decode(kit._regs, 4 * (channel + i) + 1) for i in range(4)]
+            for microstepping in (False, True):
+                frames = _step_frames(microsteps, microstepping)
+                for position in range(4 * microsteps):
+                    if [_decode(frames, 16 * position + 4 * i) for i in range(4)] == coils:
+                        self._current_microstep = position
+                        return
+        self._update_coils()
+
+    def _update_coils(self, *, microstepping: bool = False) -> None:
+        microsteps = self._microsteps
+        position = (self._current_microstep % (4 * microsteps)) * 16
+        frames = _step_frames(microsteps, microstepping)
+        self._kit._write_frame(self._channel, frames[position : position + 16], self)
+
+    def release(self) -> None:
+        """Releases all the coils so the motor can free spin, also won't use any power"""
+        self._kit._write_frame(self._channel, _RELEASED, self)
+
+    def onestep(self, *, direction: int = _FORWARD, style: int = _SINGLE) -> int:
+        """Performs one step of a particular style. The actual rotation amount will vary by style.
+        ``SINGLE`` and ``DOUBLE`` will normal cause a full step rotation. ``INTERLEAVE`` will
+        normally do a half step rotation. ``MICROSTEP`` will perform the smallest configured step.
+
+        When step styles are mixed, subsequent ``SINGLE``, ``DOUBLE`` or ``INTERLEAVE`` steps may
+        be less than normal in order to align to the desired style's pattern.
+
+        :param int direction: Either ``FORWARD`` or ``BACKWARD`` from `adafruit_motor.stepper`
+        :param int style: ``SINGLE``, ``DOUBLE``, ``INTERLEAVE`` or ``MICROSTEP``"""
+        stats = self._kit._stats
+        if stats is not None:
+            started = time.monotonic_ns()
+        # Adjust current steps based on the direction and type of step.
+        step_size = 0
+        if style == _MICROSTEP:
+            step_size = 1
+        else:
+            half_step = self._microsteps // 2
+            full_step = self._microsteps
+            # Its possible the previous steps were MICROSTEPS so first align
+            #  with the interleave pattern.
+            additional_microsteps = self._current_microstep % half_step
+            if additional_microsteps != 0:
+                # We set _current_microstep directly because our step size varies
+                # depending on the direction.
+                if direction == _FORWARD:
+                    self._current_microstep += half_step - additional_microsteps
+                else:
+                    self._current_microstep -= additional_microsteps
+                step_size = 0
+            elif style == _INTERLEAVE:
+                step_size = half_step
+
+            current_interleave = self._current_microstep // half_step
+            if (style == _SINGLE and current_interleave % 2 == 1) or (
+                style == _DOUBLE and current_interleave % 2 == 0
+            ):
+                step_size = half_step
+            elif style in {_SINGLE, _DOUBLE}:
+                step_size = full_step
+
+        if direction == _FORWARD:
+            self._current_microstep += step_size
+        else:
+            self._current_microstep -= step_size
+
+        # Now that we know our target microstep we can determine how to energize the four coils.
+        self._update_coils(microstepping=style == _MICROSTEP)
+
+        if stats is not None:
+            stats._step(self._channel, started)
+        return self._current_microstep
+
+    def move(
+        self,
+        steps: int,
+        *,
+        direction: int = _FORWARD,
+        style: int = _SINGLE,
+        rate: Optional[float] = None,
+        accel: Optional[float] = None,
+        profile: int = TRAPEZOIDAL,
+    ) -> int:
+        """Performs ``steps`` steps of a particular style, as if `onestep` was called that many
+        times, and returns the final position.
+
+        :param int steps: Number of steps to take
+        :param int direction: Either ``FORWARD`` or ``BACKWARD`` from `adafruit_motor.stepper`
+        :param int style: ``SINGLE``, ``DOUBLE``, ``INTERLEAVE`` or ``MICROSTEP``
+        :param float rate: Steps per second. If not specified, step as fast as the bus allows.
+        :param float accel: Steps per second per second to speed up from a standstill to ``rate``
+          and to slow down again before the end of the move. If not specified, the whole move is
+          at ``rate``. The step timing of a ramp is computed once and reused by later moves.
+        :param int profile: `TRAPEZOIDAL` or `S_CURVE`
+
+        .. code-block:: python
+
+            from adafruit_motor import stepper
+            from adafruit_motorkit import MotorKit
+
+            kit = MotorKit()
+
+            kit.stepper1.move(200, direction=stepper.BACKWARD, style=stepper.DOUBLE, rate=100)
+            kit.stepper1.move(2000, rate=1000, accel=2000)
+        """
+        self._kit._run(self._move(steps, direction, style, rate, accel, profile))
+        return self._current_microstep
+
+    async def move_async(
+        self,
+        steps: int,
+        *,
+        direction: int = _FORWARD,
+        style: int = _SINGLE,
+        rate: Optional[float] = None,
+        accel: Optional[float] = None,
+        profile: int = TRAPEZOIDAL,
+    ) -> int:
+        """Same as `move` but without blocking the event loop. Moves on both steppers and ramps on
+        the DC motors are driven by one scheduler task that sends the updates that are due at the
+        same time together.
+
+        .. code-block:: python
+
+            import asyncio
+            from adafruit_motorkit import MotorKit
+
+            kit = MotorKit()
+
+            async def main():
+                await asyncio.gather(
+                    kit.stepper1.move_async(200, rate=200),
+                    kit.stepper2.move_async(100, rate=100),
+                )
+
+            asyncio.run(main())
+        """
+        return await self._kit._run_async(self._move(steps, direction, style, rate, accel, profile))
+
+    def _move(
+        self,
+        steps: int,
+        direction: int,
+        style: int,
+        rate: Optional[float],
+        accel: Optional[float] = None,
+        profile: int = TRAPEZOIDAL,
+    ):
+        if steps <= 0:
+            return self._current_microstep
+        ramp = None
+        if accel:
+            from adafruit_motorkit.acceleration import _ramp
+
+            ramp = _ramp(rate, accel, profile)
+        # The first step aligns to the style's pattern, after which every step is the same size.
+        position = self.onestep(direction=direction, style=style)
+        microsteps = self._microsteps
+        if style == _MICROSTEP:
+            step_size = 1
+        elif style == _INTERLEAVE:
+            step_size = microsteps // 2
+        else:
+            step_size = microsteps
+        if direction != _FORWARD:
+            step_size = -step_size
+        cycle = 4 * microsteps
+        frames = _step_frames(microsteps, style == _MICROSTEP)
+        write_frame = self._kit._write_frame
+        channel = self._channel
+        stats = self._kit._stats
+        for deadline in _deadlines(steps, rate, ramp):
+            yield deadline
+            if stats is not None:
+                started = time.monotonic_ns()
+            position += step_size
+            offset = (position % cycle) * 16
+            write_frame(channel, frames[offset : offset + 16], self)
+            self._current_microstep = position
+            if stats is not None:
+                stats._step(channel, started)
+        return position
+
+
+class MotorKit:
+    """Class representing an Adafruit DC & Stepper Motor FeatherWing, Shield or Pi Hat kit.
+
+    :param int address: I2C address of PCA9685 PWM controller. Default address is ``0x60``.
+    :param busio.I2C i2c: I2C bus object to use. If not specified, use ``board.I2C()``.
+
+      .. note::
+        Creating a kit does not touch the hardware. The bus is opened, and the PCA9685 reset and
+        set to ``pwm_frequency``, when the first motor or stepper is used.
+
+      .. note::
+        ``board.I2C()`` uses the default I2C bus frequency of 100 kHz. To speed up
+        motor control, use an I2C bus frequency of 400 KHz, or if available, 1 MHz.
+        The PCA9685 controller supports both of these higher speeds.
+        This will noticeably speed up stepper motor operation when many steps are requested.
+        Only the register bytes that change are sent, so a channel switching between full on
+        and full off costs one byte rather than four. `probe_throughput` measures the step rate
+        a setup sustains and estimates the bus clock.
+
+    :param int steppers_microsteps: Number of microsteps per step for stepper motors. Default is 16.
+    :param float pwm_frequency: defaults to 1600 Hz
+    :param bool thread_safe: Set to ``True`` to control the kit from more than one thread, such as
+      one thread per motor. Each I2C write, and each `batch`, then holds a lock so writes from
+      different threads cannot interleave, and motors are only ever created once. Each motor
+      should still only be controlled by one thread at a time. Defaults to ``False``, which
+      avoids the cost of the lock. Using `engine` turns it on. Only for use on Raspberry Pi or
+      other SBC.
+    :param bool stats: Set to ``True`` to count writes, bytes and steps and to record their
+      latencies in `stats`. Defaults to ``False``.
+    :param bool attach: Set to ``True`` to take over a PCA9685 that is already running, such as
+      after restarting the program, without resetting it. The PWM frequency is only reprogrammed
+      if it differs, and the current channel values are read and adopted: the throttle of DC
+      motors, the position of steppers and which motors are enabled carry on as they were, so
+      motors do not glitch. Defaults to ``False``.
+    :param tuple wiring: The PCA9685 channels of the M1 to M4 terminals, each as ``(enable,
+      positive, negative)``, for boards wired differently. A stepper uses two terminals, M1 and M2
+      or M3 and M4, whose inputs must be four contiguous channels in order. Default is
+      ``((8, 9, 10), (13, 11, 12), (2, 3, 4), (7, 5, 6))``.
+    :param int write_overhead: What each I2C write costs on top of its data, in bytes of bus
+      time: the address and register bytes, the START and STOP conditions and the time taken to
+      start a write. Unchanged registers between two changes are resent, joining them into one
+      write, when that costs no more. Default is 16, which suits a Raspberry Pi at 400 kHz. Use
+      a lower value on a microcontroller, or a higher one at 1 MHz.
+    """
+
+    __slots__ = (
+        "_address",
+        "_attach",
+        "_batch_depth",
+        "_batcher",
+        "_dirty",
+        "_enabled",
+        "_engine",
+        "_hardware",
+        "_i2c",
+        "_joined",
+        "_known",
+        "_lock",
+        "_motors",
+        "_pca",
+        "_pwm_frequency",
+        "_regs",
+        "_scheduler",
+        "_stats",
+        "_steppers_microsteps",
+        "_trace",
+        "_valid",
+        "_wiring",
+        "_write_overhead",
+    )
+
+    def __init__(
+        self,
+        address: int = 0x60,
+        i2c: Optional["busio.I2C"] = None,
+        steppers_microsteps: int = 16,
+        pwm_frequency: float = 1600.0,
+        thread_safe: bool = False,
+        stats: bool = False,
+        attach: bool = False,
+        wiring: Tuple[Tuple[int, int, int], ...] = _WIRING,
+        write_overhead: int = _WRITE_OVERHEAD,
+    ) -> None:
+        if len(wiring) != 4 or any(len(terminal) != 3 for terminal in wiring):
+            raise ValueError("Wiring must give (enable, positive, negative) for four terminals")
+        self._wiring = wiring
+        self._write_overhead = write_overhead
+        # motor1 to motor4, then stepper1 and stepper2, created on first use.
+        self._motors = [None] * 6
+        self._i2c = i2c
+        self._address = address
+        self._pwm_frequency = pwm_frequency
+        self._attach = attach
+        self._pca = None
+        self._steppers_microsteps = steppers_microsteps
+        # Image of the LEDn_ON_L..LEDn_OFF_H registers. Channel n lives at [4 * n + 1:4 * n + 5] so
+        # that the byte in front of any channel can hold the register address while it is written.
+        self._regs = bytearray(65)
+        # Channels whose image is known to match the hardware, and channels waiting to be sent.
+        self._valid = 0
+        self._dirty = 0
+        # The bytes last sent to each channel, for the channels whose registers are known, so
+        # that only the bytes that differ from them need to be sent.
+        self._hardware = bytearray(65)
+        self._known = 0
+        # Channels whose changes go out in one write at the next flush, whatever it costs.
+        self._joined = 0
+        self._batch_depth = 0
+        self._batcher = _Batch(self)
+        self._enabled = 0
+        self._lock = None
+        if thread_safe:
+            import threading
+
+            self._lock = threading.RLock()
+        self._scheduler = None
+        self._engine = None
+        self._trace = None
+        self._stats = None
+        if stats:
+            from adafruit_motorkit.stats import KitStats
+
+            self._stats = KitStats(self)
+
+    def _connect(self) -> "adafruit_pca9685.PCA9685":
+        # Opens the bus and sets up the PCA9685 the first time the hardware is needed, which is
+        # before the first motor is created.
+        if self._pca is None:
+            with self._batcher:
+                if self._pca is None:
+                    i2c = self._i2c
+                    if i2c is None:
+                        import board
+
+                        i2c = board.I2C()
+                    if self._attach:
+                        self._pca = self._attached(i2c)
+                    else:
+                        from adafruit_pca9685 import PCA9685
+
+                        pca = PCA9685(i2c, address=self._address)
+                        pca.frequency = self._pwm_frequency
+                        self._pca = pca
+        return self._pca
+
+    def _attached(self, i2c: "busio.I2C") -> "adafruit_pca9685.PCA9685":
+        # Sets up a PCA9685 that may already be running, only changing what differs, and adopts
+        # its channel registers.
+        from adafruit_pca9685 import PCA9685
+
+        class AttachedPCA9685(PCA9685):
+            """A PCA9685 that keeps its running configuration when created."""
+
+            def reset(self) -> None:
+                pass
+
+        pca = AttachedPCA9685(i2c, address=self._address)
+        self._configure(pca)
+        regs = self._regs
+        with pca.i2c_device as i2c_device:
+            i2c_device.write_then_readinto(bytes((_LED0_ON_L,)), regs, in_start=1)
+        self._hardware[:] = regs
+        self._valid = 0xFFFF
+        self._known = 0xFFFF
+        for index in range(16):
+            if _decode(regs, 4 * index + 1) == 0xFFFF:
+                self._enabled |= 1 << index
+        return pca
+
+    def _configure(self, pca: "adafruit_pca9685.PCA9685") -> None:
+        # Sets up a PCA9685 whose configuration may have been lost, only changing what differs.
+        from adafruit_pca9685 import PCA9685
+
+        mode1 = pca.mode1_reg
+        prescale = int(pca.reference_clock_speed / 4096.0 / self._pwm_frequency + 0.5) - 1
+        if mode1 & 0x10 or pca.prescale_reg != prescale:
+            # Asleep after power on, or at another frequency: set it up as usual.
+            PCA9685.reset(pca)
+            pca.frequency = self._pwm_frequency
+        elif not mode1 & 0x20:
+            # Auto-increment is needed to read and write several registers at once.
+            pca.mode1_reg = (mode1 & 0x7F) | 0x20
+
+    def _write(self, index: int, value: int, motor=None) -> None:
+        # Writes a duty cycle to a channel for motor, or for the kit itself if None, skipping it
+        # if the channel already holds the same value.
+        with self._batcher:
+            offset = 4 * index + 1
+            regs = self._regs
+            bit = 1 << index
+            stats = self._stats
+            if stats is not None:
+                stats._writes[index] += 1
+            if self._valid & bit:
+                old = regs[offset : offset + 4]
+                _encode(value, regs, offset)
+                if regs[offset : offset + 4] == old:
+                    if stats is not None:
+                        stats._suppressed[index] += 1
+                    if self._trace is not None:
+                        self._trace._write(motor, index, True)
+                    return
+                self._valid &= ~bit
+            else:
+                _encode(value, regs, offset)
+            if self._trace is not None:
+                self._trace._write(motor, index, False)
+            self._dirty |= bit
+
+    def _write_frame(self, index: int, frame: bytes, motor=None) -> None:
+        # Writes a 16 byte frame to the four channels starting at index for motor, skipping the
+        # channels that already hold the same value. The changes of a frame are sent in a single
+        # write.
+        with self._batcher:
+            self._joined |= 0xF << index
+            changed = _load_frame(self._regs, 4 * index + 1, frame)
+            changed |= ~self._valid >> index & 0xF
+            stats = self._stats
+            if stats is not None:
+                for i in range(4):
+                    stats._writes[index + i] += 1
+                    if not changed >> i & 1:
+                        stats._suppressed[index + i] += 1
+            if self._trace is not None:
+                for i in range(4):
+                    self._trace._write(motor, index + i, not changed >> i & 1)
+            if not changed:
+                return
+            self._valid &= ~(changed << index)
+            self._dirty |= changed << index
+
+    def _enable(self, index: int) -> None:
+        # Turns on a driver enable pin and remembers it so it can be restored.
+        self._enabled |= 1 << index
+        self._write(index, 0xFFFF)
+
+    def _flush(self) -> None:
+        # Send the bytes of the dirty channels that differ from what the PCA9685 holds, each run
+        # of them as one auto-increment write. The PCA9685 library leaves auto-increment enabled
+        # once the frequency has been set.
+        dirty = self._dirty
+        if not dirty:
+            self._joined = 0
+            return
+        runs = self._runs(dirty)
+        self._dirty = self._joined = 0
+        try:
+            with self._pca.i2c_device as i2c:
+                for start, end in runs:
+                    self._send(i2c, start, end)
+        except BaseException:
+            # Bytes already sent now match, so only the rest goes out again next flush.
+            self._dirty |= dirty
+            raise
+        self._valid |= dirty
+        self._known |= dirty
+
+    def _runs(self, dirty: int) -> list:
+        # The (start, end) image byte ranges to write for the dirty channels. Two ranges are joined
+        # when resending the unchanged bytes between them costs no more than another write, or
+        # when every channel from one to the other is in _joined. Only bytes whose value on the
+        # PCA9685 is known can be resent, so ranges are never joined across a channel that is
+        # neither known nor being written.
+        regs = self._regs
+        hardware = self._hardware
+        known = self._known
+        joined = self._joined
+        overhead = self._write_overhead
+        runs = []
+        joinable = forced = False
+        index = 0
+        while dirty:
+            if not joined >> index & 1:
+                forced = False
+            if dirty & 1:
+                low = 4 * index + 1
+                high = low + 4
+                if known >> index & 1:
+                    # Only the bytes that changed, if any.
+                    while low < high and regs[low] == hardware[low]:
+                        low += 1
+                    while low < high and regs[high - 1] == hardware[high - 1]:
+                        high -= 1
+                if low < high:
+                    if joinable and (forced or low - runs[-1][1] <= overhead):
+                        runs[-1] = (runs[-1][0], high)
+                    else:
+                        runs.append((low, high))
+                    joinable = True
+                    forced = joined >> index & 1
+            elif not known >> index & 1:
+                joinable = False
+            dirty >>= 1
+            index += 1
+        return runs
+
+    def _send(self, i2c: "adafruit_bus_device.i2c_device.I2CDevice", start: int, end: int) -> None:
+        # Writes the image bytes start up to end, the byte in front holding the register address.
+        regs = self._regs
+        stats = self._stats
+        before = start - 1
+        saved = regs[before]
+        regs[before] = _LED0_ON_L + before
+        if stats is not None:
+            started = time.monotonic_ns()
+        try:
+            i2c.write(regs, start=before, end=end)
+        except BaseException:
+            # Some of the bytes may have been written: forget what these channels hold.
+            self._known &= ~_span((before >> 2, (end - 2) >> 2))
+            raise
+        finally:
+            regs[before] = saved
+        self._hardware[start:end] = regs[start:end]
+        if stats is not None:
+            stats._transaction(start, end, started)
+        if self._trace is not None:
+            self._trace._record(_LED0_ON_L + before, bytes(regs[start:end]))
+
+    @staticmethod
+    def _run(generator):
+        # Runs a motion generator to completion, sleeping until each update is due.
+        monotonic_ns = time.monotonic_ns
+        sleep = time.sleep
+        try:
+            while True:
+                delay = next(generator) - monotonic_ns()
+                if delay > 0:
+                    sleep(delay / 1_000_000_000)
+        except StopIteration as stop:
+            return stop.value
+
+    async def _run_async(self, generator):
+        # Runs a motion generator on the kit's scheduler task, without blocking the event loop.
+        if self._scheduler is None:
+            from adafruit_motorkit.scheduler import _Scheduler
+
+            self._scheduler = _Scheduler(self)
+        return await self._scheduler.run(generator)
+
+    def move_together(
+        self,
+        steps1: int,
+        steps2: int,
+        *,
+        style: int = _SINGLE,
+        rate: Optional[float] = None,
+        accel: Optional[float] = None,
+        profile: int = TRAPEZOIDAL,
+    ) -> Tuple[int, int]:
+        """Moves stepper1 and stepper2 at the same time so that both start and finish together,
+        like an XY table moving along a straight line. The stepper with more steps to take steps
+        on every tick and the other one is spread evenly across the same ticks. Each tick's steps of
+        both steppers are sent in a single I2C transaction. Returns the final positions of both
+        steppers.
+
+        :param int steps1: Steps for stepper1. Negative values move ``BACKWARD``.
+        :param int steps2: Steps for stepper2. Negative values move ``BACKWARD``.
+        :param int style: ``SINGLE``, ``DOUBLE``, ``INTERLEAVE`` or ``MICROSTEP``
+        :param float rate: Ticks per second. If not specified, step as fast as the bus allows.
+        :param float accel: Ticks per second per second to speed up to ``rate`` and slow down
+          again. If not specified, the whole move is at ``rate``.
+        :param int profile: `TRAPEZOIDAL` or `S_CURVE`
+
+        .. code-block:: python
+
+            from adafruit_motorkit import MotorKit
+
+            kit = MotorKit()
+
+            kit.move_together(300, -100, rate=200)
+        """
+        from adafruit_motorkit.group import _move_together
+
+        return self._run(_move_together(self, steps1, steps2, style, rate, accel, profile))
+
+    def slew(self, targets: dict, slew_rate: float, *, rate: float = 50.0) -> None:
+        """Changes the throttle of several DC motors towards their targets, none faster than
+        ``slew_rate``, so sudden jumps cannot brown out the supply. Every motor still changing is
+        updated on each tick, and all of a tick's updates are sent together. Returns once every
+        motor has reached its target.
+
+        :param dict targets: Target throttle, from -1.0 to 1.0, for each motor by name, such as
+          ``{"motor1": 1.0, "motor2": 1.0}``
+        :param float slew_rate: The largest change of throttle per second
+        :param float rate: Ticks per second. Defaults to 50.
+
+        .. code-block:: python
+
+            from adafruit_motorkit import MotorKit
+
+            kit = MotorKit()
+
+            # Full speed in half a second, then stop as fast as it is safe to.
+            kit.slew({"motor1": 1.0, "motor2": 1.0}, 2.0)
+            kit.slew({"motor1": 0, "motor2": 0}, 4.0)
+        """
+        from adafruit_motorkit.group import _slew
+
+        self._run(_slew(self, targets, slew_rate, rate))
+
+    async def slew_async(self, targets: dict, slew_rate: float, *, rate: float = 50.0) -> None:
+        """Same as `slew` but without blocking the event loop."""
+        from adafruit_motorkit.group import _slew
+
+        await self._run_async(_slew(self, targets, slew_rate, rate))
+
+    def play(self, frames, rate: float, *, style: int = _SINGLE, buffer: int = 16) -> int:
+        """Drives the motors from a stream of frames, one frame every ``1 / rate`` seconds. Each
+        frame is a mapping from motor names to new states: a throttle for ``"motor1"`` to
+        ``"motor4"``, and a whole number of steps for ``"stepper1"`` and ``"stepper2"``, negative to
+        move ``BACKWARD``, which can also be given as a float such as ``2.0``. Motors left out of a
+        frame stay as they are. All of a frame's updates are sent together; when a stepper has more
+        than one step in a frame, the extra steps are made one after another first.
+
+        Frames are read as they are needed, so memory use does not grow with the length of the
+        stream, and on Raspberry Pi or other SBC up to ``buffer`` frames are read ahead on a
+        background thread so producing them overlaps with waiting for the next tick. Returns the
+        number of frames played.
+
+        :param frames: Any iterable of frames, such as a generator
+        :param float rate: Frames per second
+        :param int style: ``SINGLE``, ``DOUBLE``, ``INTERLEAVE`` or ``MICROSTEP``, for every step
+        :param int buffer: Number of frames to read ahead. 0 reads each frame when it is due.
+
+        .. code-block:: python
+
+            from adafruit_motorkit import MotorKit
+
+            kit = MotorKit()
+
+            def frames():
+                for i in range(1000):
+                    yield {"stepper1": 1, "motor3": i / 1000}
+
+            kit.play(frames(), rate=500)
+        """
+        from adafruit_motorkit.group import _play
+
+        return self._run(_play(self, frames, rate, style, buffer))
+
+    @property
+    def engine(self) -> "adafruit_motorkit.engine.MotionEngine":
+        """The kit's `adafruit_motorkit.engine.MotionEngine`, which runs queued motor commands on
+        a background thread. Created on first use, and again after the engine is stopped. Turns on
+        ``thread_safe`` locking. Only for use on Raspberry Pi or other SBC."""
+        if self._engine is None:
+            from adafruit_motorkit.engine import MotionEngine
+
+            with self._batcher:
+                if self._engine is None:
+                    self._engine = MotionEngine(self)
+        return self._engine
+
+    @property
+    def stats(self) -> Optional["adafruit_motorkit.stats.KitStats"]:
+        """The kit's `adafruit_motorkit.stats.KitStats`: counts of writes, suppressed writes,
+        bytes and steps, and latency histograms, for the kit and each motor. ``None`` unless the
+        kit was created with ``stats=True``.
+
+        .. code-block:: python
+
+            from adafruit_motorkit import MotorKit
+
+            kit = MotorKit(stats=True)
+
+            kit.motor1.throttle = 0.5
+            print(kit.stats.snapshot()["motors"]["motor1"])
+        """
+        return self._stats
+
+    def trace(self, path: str) -> "adafruit_motorkit.trace.Tracer":
+        """Starts recording to the file at ``path`` every channel write, with the motor that
+        made it and whether it was sent or skipped as redundant, and every I2C transaction sent,
+        with their times, for analysis with ``python -m adafruit_motorkit.trace``. Returns
+        the `adafruit_motorkit.trace.Tracer`; close it, or use it in a ``with`` block, to stop.
+        Only for use on Raspberry Pi or other SBC.
+
+        .. code-block:: python
+
+            from adafruit_motorkit import MotorKit
+
+            kit = MotorKit()
+
+            with kit.trace("run.trace"):
+                kit.motor1.throttle = 0.5
+                kit.motor1.throttle = 0
+        """
+        from adafruit_motorkit.trace import Tracer
+
+        return Tracer(self, path)
+
+    def probe_throughput(self, iterations: int = 200) -> dict:
+        """Measures the step and DC update rates this kit sustains on its bus, to tune motion
+        parameters to the installation. Nothing moves: the probe runs on the M1 and M2 terminals
+        with their driver enable pins turned off, and puts every channel back as it was when it is
+        done. Run it while the motors are stopped and not in use from other threads; motors on M1
+        and M2 are off while it runs. Only for use on Raspberry Pi or other SBC.
+
+        Returns a dictionary of:
+
+        * ``"bus_frequency"``: the bus clock in Hertz, estimated from how much longer a write of
+          many channels takes than a write of one, or ``None`` if the bus is too fast to tell, as
+          with a simulated bus that does not model bus time.
+        * ``"transaction_us"``: the typical time of a write, by its number of channels: one, and
+          the longest run of channels the probe can rewrite safely: those of M1 and M2 and those
+          whose registers the kit knows, because it has written them since it started or since
+          `resync`.
+        * ``"dc"``: the typical time of a DC throttle change, and the most changes per second that
+          99% of them keep up with.
+        * ``"steps"``: for each stepping style, the typical time of a step, the most steps per
+          second that 99% of steps keep up with, the bytes sent per step and, if the bus clock is
+          known, the step rate projected at 100 kHz, 400 kHz and 1 MHz.
+
+        :param int iterations: Number of writes, updates and steps timed for each figure
+
+        .. code-block:: python
+
+            from adafruit_motorkit import MotorKit
+
+            kit = MotorKit()
+
+            results = kit.probe_throughput()
+            print(results["bus_frequency"], results["steps"]["SINGLE"]["max_step_rate"])
+        """
+        from adafruit_motorkit.probe import probe
+
+        return probe(self, iterations)
+
+    def resync(self) -> None:
+        """Forgets the cached copy of the PCA9685 channel registers. Unchanged values are not sent
+        to the PCA9685 again, so call this after something other than this kit has changed the
+        registers, such as another process or a chip reset. The PWM frequency and auto-increment
+        are set up again if they were lost, the driver enable pins of the motors in use are
+        turned back on, and the next write to every other channel is then sent."""
+        with self._batcher:
+            self._valid = 0
+            self._known = 0
+            if self._pca is not None:
+                self._configure(self._pca)
+                for index in range(16):
+                    if self._enabled >> index & 1:
+                        self._write(index, 0xFFFF)
+
+    def batch(self) -> _Batch:
+        """Context manager that collects motor and stepper updates and sends them when the
+        outermost ``with`` block exits. Only the register bytes that changed are sent, and
+        unchanged registers between them are resent to join the changes into one I2C
+        transaction whenever that costs less than another transaction, as set by the kit's
+        ``write_overhead``. Updating all four DC motors is then a single transaction.
+
+        .. code-block:: python
+
+            from adafruit_motorkit import MotorKit
+
+            kit = MotorKit()
+
+            with kit.batch():
+                kit.motor1.throttle = 1.0
+                kit.motor2.throttle = -1.0
+                kit.motor3.throttle = 0.5
+                kit.motor4.throttle = 0
+        """
+        return self._batcher
+
+    # Every motor and stepper is created from the wiring table by these two methods, rather than
+    # each property having its own copy of the wiring and checks.
+    def _motor(self, index: int) -> _DCMotor:
+        motor = self._motors[index]
+        if motor is None:
+            self._connect()
+            with self._batcher:
+                motor = self._motors[index]
+                if motor is None:
+                    if self._motors[4 + index // 2]:
+                        raise RuntimeError(
+                            f"Cannot use motor{index + 1} at the same time as "
+                            f"stepper{index // 2 + 1}."
+                        )
+                    enable, positive, negative = self._wiring[index]
+                    self._enable(enable)
+                    motor = self._motors[index] = _DCMotor(self, positive, negative)
+        return motor
+
+    def _stepper(self, index: int) -> _StepperMotor:
+        stepper = self._motors[4 + index]
+        if stepper is None:
+            self._connect()
+            with self._batcher:
+                stepper = self._motors[4 + index]
+                if stepper is None:
+                    if self._motors[2 * index] or self._motors[2 * index + 1]:
+                        raise RuntimeError(
+                            f"Cannot use stepper{index + 1} at the same time as "
+                            f"motor{2 * index + 1} or motor{2 * index + 2}."
+                        )
+                    first = self._wiring[2 * index]
+                    second = self._wiring[2 * index + 1]
+                    channel = first[1]
+                    if (first[2], second[1], second[2]) != (channel + 1, channel + 2, channel + 3):
+                        raise ValueError(
+                            f"stepper{index + 1} needs its four inputs on contiguous channels"
+                        )
+                    self._enable(first[0])
+                    self._enable(second[0])
+                    stepper = _StepperMotor(self, channel, self._steppers_microsteps)
+                    self._motors[4 + index] = stepper
+        return stepper
+
+    @property
+    def motor1(self) -> _DCMotor:
+        """:py:class:``~adafruit_motor.motor.DCMotor`` compatible controls for motor 1.
+
+        The following image shows the location of the M1 terminal on the DC/Stepper FeatherWing.
+        The label on the FeatherWing is found on the bottom of the board.
+        The terminal is labeled on the top of the Shield and Pi Hat.
+
+        .. image :: ../docs/_static/motor_featherwing/m1.jpg
+          :alt: Motor 1 location
+
+        This example moves the motor forwards for one fifth of a second at full speed.
+
+        .. code-block:: python
+
+            import time
+            from adafruit_motorkit import motorkit
+
+            kit = MotorKit()
+
+            kit.motor1.throttle = 1.0
+            time.sleep(0.2)
+
+            kit.motor1.throttle = 0
+        """
+        return self._motor(0)
+
+    @property
+    def motor2(self) -> _DCMotor:
+        """:py:class:``~adafruit_motor.motor.DCMotor`` compatible controls for motor 2.
+
+        The following image shows the location of the M2 terminal on the DC/Stepper FeatherWing.
+        The label on the FeatherWing is found on the bottom of the board.
+        The terminal is labeled on the top of the Shield and Pi Hat.
+
+        .. image :: ../docs/_static/motor_featherwing/m2.jpg
+          :alt: Motor 2 location
+
+        This example moves the motor forwards for one fifth of a second at full speed.
+
+        .. code-block:: python
+
+            import time
+            from adafruit_motorkit import motorkit
+
+            kit = MotorKit()
+
+            kit.motor2.throttle = 1.0
+            time.sleep(0.2)
+
+            kit.motor1.throttle = 0
+        """
+        return self._motor(1)
+
+    @property
+    def motor3(self) -> _DCMotor:
+        """:py:class:``~adafruit_motor.motor.DCMotor`` compatible controls for motor 3.
+
+        The following image shows the location of the M2 terminal on the DC/Stepper FeatherWing.
+        The label on the FeatherWing is found on the bottom of the board.
+        The terminal is labeled on the top of the Shield and Pi Hat.
+
+        .. image :: ../docs/_static/motor_featherwing/m3.jpg
+          :alt: Motor 3 location
+
+        This example moves the motor forwards for one fifth of a second at full speed.
+
+        .. code-block:: python
+
+            import time
+            from adafruit_motorkit import motorkit
+
+            kit = MotorKit()
+
+            kit.motor3.throttle = 1.0
+            time.sleep(0.2)
+
+            kit.motor1.throttle = 0
+        """
+        return self._motor(2)
+
+    @property
+    def motor4(self) -> _DCMotor:
+        """:py:class:``~adafruit_motor.motor.DCMotor`` compatible controls for motor 4.
+
+        .. image :: ../docs/_static/motor_featherwing/m4.jpg
+          :alt: Motor 4 location
+
+        This example moves the motor forwards for one fifth of a second at full speed.
+
+        .. code-block:: python
+
+            import time
+            from adafruit_motorkit import motorkit
+
+            kit = MotorKit()
+
+            kit.motor4.throttle = 1.0
+            time.sleep(0.2)
+
+            kit.motor1.throttle = 0
+        """
+        return self._motor(3)
+
+    @property
+    def stepper1(self) -> _StepperMotor:
+        """:py:class:``~adafruit_motor.stepper.StepperMotor`` compatible controls for one connected
+        to stepper 1 (also labeled motor 1 and motor 2).
+
+         The following image shows the location of the stepper1 terminals on the DC/Stepper
+         FeatherWing. stepper1 is made up of the M1 and M2 terminals.
+         The labels on the FeatherWing are found on the bottom of the board.
+         The terminals are labeled on the top of the Shield and Pi Hat.
+
+         .. image :: ../docs/_static/motor_featherwing/stepper1.jpg
+           :alt: Stepper 1 location
+
+         This example moves the stepper motor 100 steps forwards.
+
+         .. code-block:: python
+
+             from adafruit_motorkit import MotorKit
+
+             kit = MotorKit()
+
+             for i in range(100):
+                 kit.stepper1.onestep()
+        """
+        return self._stepper(0)
+
+    @property
+    def stepper2(self) -> _StepperMotor:
+        """:py:class:``~adafruit_motor.stepper.StepperMotor`` compatible controls for one connected
+        to stepper 2 (also labeled motor 3 and motor 4).
+
+         The following image shows the location of the stepper2 terminals on the DC/Stepper
+         FeatherWing. stepper2 is made up of the M3 and M4 terminals.
+         The labels on the FeatherWing are found on the bottom of the board.
+         The terminals are labeled on the top of the Shield and Pi Hat.
+
+         .. image :: ../docs/_static/motor_featherwing/stepper2.jpg
+           :alt: Stepper 2 location
+
+         This example moves the stepper motor 100 steps forwards.
+
+         .. code-block:: python
+
+             from adafruit_motorkit import MotorKit
+
+             kit = MotorKit()
+
+             for i in range(100):
+                 kit.stepper2.onestep()
+        """
+        return self._stepper(1)
+
+    @property
+    def frequency(self) -> float:
+        """The overall PCA9685 PWM frequency in Hertz."""
+        return self._connect().frequency
+
+    @frequency.setter
+    def frequency(self, pwm_frequency: float = 1600.0) -> None:
+        with self._batcher:
+            self._pwm_frequency = pwm_frequency
+            if self._pca is not None:
+                self._pca.frequency = pwm_frequency
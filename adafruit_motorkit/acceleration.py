@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_motorkit.acceleration`
+====================================================
+
+Step timing of the acceleration ramps used by `adafruit_motorkit.MotorKit` moves given an
+``accel``, with the `adafruit_motorkit.TRAPEZOIDAL` and `adafruit_motorkit.S_CURVE` profiles. It
+is only imported by a move that accelerates, so the core library stays small on microcontrollers.
+"""
+
+import array
+import math
+
+from adafruit_motorkit import S_CURVE, TRAPEZOIDAL
+
+# Step intervals of recently used acceleration ramps, keyed by (rate, accel, profile).
+_RAMPS = {}
+
+
+def _s_curve_times(steps: int, rate: float, period: float) -> list:
+    # The times at which an S-curve ramp's position, rate / 2 * (t - sin(w * t) / w), reaches
+    # each step, by Newton's method starting one step on from the step before. The position
+    # grows as t ** 3 at first, where the speed is too close to zero to start from, so the first
+    # steps start from that cube law instead. Newton's method converges quadratically, so once a
+    # correction is below 0.1 us the time is well within a nanosecond.
+    omega = math.pi / period
+    half = rate / 2
+    times = [0.0]
+    time_ = 0.0
+    speed = 0.0
+    for step in range(1, steps + 1):
+        if speed * time_ > 1:
+            time_ += 1 / speed
+        else:
+            time_ = (12 * step / (rate * omega * omega)) ** (1 / 3)
+        for _ in range(8):
+            speed = half * (1 - math.cos(omega * time_))
+            correction = (half * (time_ - math.sin(omega * time_) / omega) - step) / speed
+            time_ -= correction
+            if -1e-7 < correction < 1e-7:
+                break
+        time_ = min(time_, period)
+        times.append(time_)
+    return times
+
+
+def _ramp(rate: float, accel: float, profile: int) -> array.array:
+    """Returns the intervals in nanoseconds between the steps of an acceleration from standstill
+    to ``rate``. Decelerating uses the same intervals in reverse."""
+    key = (rate, accel, profile)
+    ramp = _RAMPS.get(key)
+    if ramp is None:
+        if not rate:
+            raise ValueError("A rate is required to accelerate to")
+        if accel <= 0:
+            raise ValueError("Acceleration must be positive")
+        if profile == TRAPEZOIDAL:
+            steps = math.ceil(rate * rate / (2 * accel))
+            times = [math.sqrt(2 * step / accel) for step in range(steps + 1)]
+        elif profile == S_CURVE:
+            # Speed follows half a cosine wave, peaking in acceleration at accel halfway through.
+            period = math.pi * rate / (2 * accel)
+            steps = math.ceil(rate * period / 2)
+            times = _s_curve_times(steps, rate, period)
+        else:
+            raise ValueError("Unsupported acceleration profile.")
+        minimum = 1 / rate
+        ramp = array.array(
+            "L",
+            [int(max(times[i + 1] - times[i], minimum) * 1_000_000_000) for i in range(steps)],
+        )
+        if len(_RAMPS) >= 8:
+            _RAMPS.clear()
+        _RAMPS[key] = ramp
+    return ramp
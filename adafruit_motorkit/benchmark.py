@@ -0,0 +1,347 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_motorkit.benchmark`
+====================================================
+
+Measures the cost of common `adafruit_motorkit.MotorKit` operations against the simulated bus in
+`adafruit_motorkit.simulator`, and prints the results as JSON so they can be compared between
+releases. Only for use on Raspberry Pi or other SBC.
+
+Reported for each stepping style and microstep setting: Python time, I2C transactions and bytes per
+step, and the step time and rate once the modelled bus time is added. For each style, the Python
+time, transactions and bytes per tick of `adafruit_motorkit.MotorKit.move_together` are reported
+too, checked to be one transaction per tick. Also reported are the latency of updating all four DC
+motors, one at a time and as one batch, the time to construct a kit and access its first motor,
+which sets up the PCA9685, and startup: the time to import the library in a new interpreter and the
+latency of the first command on a new kit, checked against `STARTUP_TARGETS`. Memory use is reported
+as the size of the library's bytecode, with and without docstrings, and the heap used by a kit with
+four DC motors or two steppers. Where ``mpy-cross`` is available, each module is also compiled to
+the ``.mpy`` file CircuitPython loads and its size reported, and given a MicroPython based
+interpreter such as the CircuitPython or MicroPython unix port, so is the heap the core library
+keeps once imported. Bus time is modelled at 100 kHz, 400 kHz and 1 MHz unless other speeds are
+given, plus `DRIVER_US` for each transaction.
+
+.. code-block:: shell
+
+    python -m adafruit_motorkit.benchmark --iterations 2000 --output results.json
+"""
+
+import argparse
+import json
+import marshal
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import adafruit_motorkit
+from adafruit_motorkit import (
+    _BACKWARD,
+    _DOUBLE,
+    _FORWARD,
+    _INTERLEAVE,
+    _MICROSTEP,
+    _SINGLE,
+    MotorKit,
+    __version__,
+)
+from adafruit_motorkit.simulator import SimulatedI2C
+
+try:
+    from typing import List, Optional, Sequence
+except ImportError:
+    pass
+
+BUS_FREQUENCIES = (100_000, 400_000, 1_000_000)
+"""The bus clocks, in Hertz, that results are modelled at by default."""
+
+DRIVER_US = 250.0
+"""Microseconds the I2C driver takes to start each transaction by default, about what Linux takes
+on a Raspberry Pi. It is added to the modelled bus time of every transaction."""
+
+STARTUP_TARGETS = {"import_ms": 40.0, "first_command_ms": 10.0}
+"""Startup times, in milliseconds, that the library should stay within."""
+
+_STYLES = (
+    ("SINGLE", _SINGLE),
+    ("DOUBLE", _DOUBLE),
+    ("INTERLEAVE", _INTERLEAVE),
+    ("MICROSTEP", _MICROSTEP),
+)
+_MICROSTEPS = (8, 16, 32)
+
+
+def _bus(
+    i2c: SimulatedI2C, first: int, frequencies: Sequence[int], driver_us: float, count: int
+) -> dict:
+    # Traffic since transaction ``first``, per operation, and the modelled bus time at each clock,
+    # including the driver's time for each transaction.
+    transactions = i2c.transactions[first:]
+    return {
+        "transactions": len(transactions) / count,
+        "bytes": sum(transaction.size for transaction in transactions) / count,
+        "bus_us": {
+            str(frequency): (
+                sum(transaction.duration(frequency) for transaction in transactions) / 1000
+                + driver_us * len(transactions)
+            )
+            / count
+            for frequency in frequencies
+        },
+    }
+
+
+def _step(
+    style: str, microsteps: int, frequencies: Sequence[int], driver_us: float, iterations: int
+) -> dict:
+    i2c = SimulatedI2C()
+    kit = MotorKit(i2c=i2c, steppers_microsteps=microsteps)
+    stepper = kit.stepper1
+    value = dict(_STYLES)[style]
+    # Reverse every full revolution of the step sequence, so each step changes the coils.
+    span = 4 * microsteps if value == _MICROSTEP else 8
+    first = len(i2c.transactions)
+    start = time.perf_counter_ns()
+    for i in range(iterations):
+        stepper.onestep(direction=_FORWARD if i // span % 2 == 0 else _BACKWARD, style=value)
+    python_us = (time.perf_counter_ns() - start) / iterations / 1000
+    result = {"style": style, "microsteps": microsteps, "python_us": python_us}
+    result.update(_bus(i2c, first, frequencies, driver_us, iterations))
+    result["steps_per_second"] = {
+        frequency: 1_000_000 / (python_us + bus_us)
+        for frequency, bus_us in result["bus_us"].items()
+    }
+    return result
+
+
+def _together(style: str, frequencies: Sequence[int], driver_us: float, iterations: int) -> dict:
+    i2c = SimulatedI2C()
+    kit = MotorKit(i2c=i2c)
+    kit.stepper1.release()
+    kit.stepper2.release()
+    first = len(i2c.transactions)
+    start = time.perf_counter_ns()
+    kit.move_together(iterations, -(iterations // 3), style=dict(_STYLES)[style])
+    python_us = (time.perf_counter_ns() - start) / iterations / 1000
+    result = {"style": style, "python_us": python_us}
+    result.update(_bus(i2c, first, frequencies, driver_us, iterations))
+    # Both steppers' steps of a tick should share one transaction.
+    result["one_write_per_tick"] = len(i2c.transactions) - first == iterations
+    return result
+
+
+def _dc(batched: bool, frequencies: Sequence[int], driver_us: float, iterations: int) -> dict:
+    i2c = SimulatedI2C()
+    kit = MotorKit(i2c=i2c)
+    motors = (kit.motor1, kit.motor2, kit.motor3, kit.motor4)
+    first = len(i2c.transactions)
+    start = time.perf_counter_ns()
+    for i in range(iterations):
+        throttle = 0.5 if i % 2 else -0.5
+        if batched:
+            with kit.batch():
+                for motor in motors:
+                    motor.throttle = throttle
+        else:
+            for motor in motors:
+                motor.throttle = throttle
+    python_us = (time.perf_counter_ns() - start) / iterations / 1000
+    result = {"batched": batched, "python_us": python_us}
+    result.update(_bus(i2c, first, frequencies, driver_us, iterations))
+    result["latency_us"] = {
+        frequency: python_us + bus_us for frequency, bus_us in result["bus_us"].items()
+    }
+    return result
+
+
+def _construction(iterations: int) -> dict:
+    buses = [SimulatedI2C() for _ in range(iterations)]
+    start = time.perf_counter_ns()
+    for i2c in buses:
+        MotorKit(i2c=i2c).motor1
+    python_us = (time.perf_counter_ns() - start) / iterations / 1000
+    return {"python_us": python_us, "transactions": len(buses[0].transactions)}
+
+
+def _startup(iterations: int) -> dict:
+    # Imports in a new interpreter so nothing is already loaded.
+    code = (
+        "import time; start = time.perf_counter_ns(); import adafruit_motorkit; "
+        "print(time.perf_counter_ns() - start)"
+    )
+    imports = [
+        int(subprocess.check_output([sys.executable, "-c", code])) for _ in range(iterations)
+    ]
+    first = []
+    for _ in range(iterations):
+        kit = MotorKit(i2c=SimulatedI2C())
+        start = time.perf_counter_ns()
+        kit.motor1.throttle = 0.5
+        first.append(time.perf_counter_ns() - start)
+    result = {
+        "import_ms": sorted(imports)[iterations // 2] / 1_000_000,
+        "first_command_ms": sorted(first)[iterations // 2] / 1_000_000,
+    }
+    result["targets_ms"] = STARTUP_TARGETS
+    result["met"] = all(result[name] <= target for name, target in STARTUP_TARGETS.items())
+    return result
+
+
+def _mpy(mpy_cross: str, micropython: Optional[str]) -> dict:
+    # Compiles every module of the library into a package of .mpy files, and imports the core
+    # from it in a new MicroPython based interpreter to see how much heap it keeps.
+    source = os.path.dirname(adafruit_motorkit.__file__)
+    result = {"mpy_bytes": {}, "import_heap_bytes": None}
+    with tempfile.TemporaryDirectory() as directory:
+        package = os.path.join(directory, "adafruit_motorkit")
+        os.mkdir(package)
+        for filename in sorted(os.listdir(source)):
+            if not filename.endswith(".py"):
+                continue
+            module = filename[:-3]
+            output = os.path.join(package, module + ".mpy")
+            subprocess.run([mpy_cross, "-o", output, os.path.join(source, filename)], check=True)
+            name = "adafruit_motorkit" if module == "__init__" else "adafruit_motorkit." + module
+            result["mpy_bytes"][name] = os.path.getsize(output)
+        if micropython is not None:
+            code = (
+                "import gc; gc.collect(); start = gc.mem_alloc(); import adafruit_motorkit; "
+                "gc.collect(); print(gc.mem_alloc() - start)"
+            )
+            env = dict(os.environ, MICROPYPATH=directory)
+            output = subprocess.check_output([micropython, "-c", code], env=env)
+            result["import_heap_bytes"] = int(output)
+    return result
+
+
+def _memory(mpy_cross: Optional[str] = None, micropython: Optional[str] = None) -> dict:
+    path = adafruit_motorkit.__file__
+    with open(path, encoding="utf-8") as file:
+        source = file.read()
+    result = {
+        "bytecode_bytes": len(marshal.dumps(compile(source, path, "exec"))),
+        "bytecode_stripped_bytes": len(marshal.dumps(compile(source, path, "exec", optimize=2))),
+    }
+    for name, motors in (
+        ("dc_kit_bytes", ("motor1", "motor2", "motor3", "motor4")),
+        ("stepper_kit_bytes", ("stepper1", "stepper2")),
+    ):
+        kits = []
+        for _ in range(2):
+            # The first kit fills the shared caches and stays alive, the second is measured.
+            i2c = SimulatedI2C()
+            tracemalloc.start()
+            try:
+                before = tracemalloc.take_snapshot()
+                kit = MotorKit(i2c=i2c)
+                for motor in motors:
+                    getattr(kit, motor)
+                after = tracemalloc.take_snapshot()
+            finally:
+                tracemalloc.stop()
+            kits.append(kit)
+        result[name] = sum(
+            stat.size_diff
+            for stat in after.compare_to(before, "filename")
+            if stat.traceback[0].filename == path
+        )
+    if mpy_cross is None:
+        result.update({"mpy_bytes": None, "import_heap_bytes": None})
+    else:
+        result.update(_mpy(mpy_cross, micropython))
+    return result
+
+
+def run(
+    iterations: int = 1000,
+    frequencies: Sequence[int] = BUS_FREQUENCIES,
+    driver_us: float = DRIVER_US,
+    mpy_cross: Optional[str] = None,
+    micropython: Optional[str] = None,
+) -> dict:
+    """Runs every benchmark and returns the results.
+
+    :param int iterations: Number of times each operation is timed
+    :param list frequencies: Bus clocks in Hertz to model the bus time at
+    :param float driver_us: Microseconds the driver takes to start each transaction
+    :param str mpy_cross: Path of the ``mpy-cross`` compiler to measure the ``.mpy`` sizes
+      with. The sizes are ``None`` if not given.
+    :param str micropython: Path of a MicroPython based interpreter, such as the CircuitPython or
+      MicroPython unix port, to measure the heap used by importing the library with. Needs
+      ``mpy_cross`` too. The heap is ``None`` if not given.
+    """
+    steps = [
+        _step(name, microsteps, frequencies, driver_us, iterations)
+        for name, _ in _STYLES
+        for microsteps in _MICROSTEPS
+    ]
+    return {
+        "version": __version__,
+        "python": sys.version.split()[0],
+        "iterations": iterations,
+        "steps": steps,
+        "move_together": [
+            _together(name, frequencies, driver_us, iterations) for name, _ in _STYLES
+        ],
+        "dc": [
+            _dc(False, frequencies, driver_us, iterations),
+            _dc(True, frequencies, driver_us, iterations),
+        ],
+        "construction": _construction(max(1, iterations // 10)),
+        "startup": _startup(5),
+        "memory": _memory(mpy_cross, micropython),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Runs the benchmarks from the command line and prints or saves the JSON results."""
+    parser = argparse.ArgumentParser(prog="python -m adafruit_motorkit.benchmark")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument(
+        "--frequency",
+        type=int,
+        action="append",
+        help="bus clock in Hz to model, may be repeated (default: 100000, 400000 and 1000000)",
+    )
+    parser.add_argument(
+        "--driver-us",
+        type=float,
+        default=DRIVER_US,
+        help=f"microseconds the driver takes per transaction (default: {DRIVER_US})",
+    )
+    parser.add_argument(
+        "--mpy-cross",
+        default=shutil.which("mpy-cross"),
+        help="mpy-cross compiler to measure .mpy sizes with (default: mpy-cross on the PATH)",
+    )
+    parser.add_argument(
+        "--micropython",
+        default=shutil.which("micropython"),
+        help="MicroPython based interpreter to measure the heap used by the import with "
+        "(default: micropython on the PATH)",
+    )
+    parser.add_argument("--output", help="file to write the results to instead of stdout")
+    args = parser.parse_args(argv)
+    results = run(
+        args.iterations,
+        args.frequency or BUS_FREQUENCIES,
+        args.driver_us,
+        args.mpy_cross,
+        args.micropython,
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,480 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_motorkit.daemon`
+====================================================
+
+A daemon that owns a `adafruit_motorkit.MotorKit` and serves it to other processes over a Unix
+domain socket, so several programs can share one kit without each resetting the PCA9685 or
+interleaving their writes. Commands that arrive together from one client are sent to the PCA9685
+together, and stepper moves from every client are driven by the kit's single scheduler. Only for
+use on Raspberry Pi or other SBC.
+
+Start the daemon, here against a simulated bus:
+
+.. code-block:: shell
+
+    python -m adafruit_motorkit.daemon --socket /tmp/motorkit.sock --simulate
+
+and use `MotorKitClient` in place of a `adafruit_motorkit.MotorKit`:
+
+.. code-block:: python
+
+    from adafruit_motor import stepper
+    from adafruit_motorkit.daemon import MotorKitClient
+
+    kit = MotorKitClient("/tmp/motorkit.sock")
+
+    kit.motor3.throttle = 0.5
+    kit.stepper1.move(200, direction=stepper.BACKWARD, rate=200)
+    with kit.batch():
+        kit.motor3.throttle = 0
+        kit.motor4.throttle = 0
+
+Every request and reply is a fixed size little endian record. A request is ``<HBBBBif``: a
+request id, an operation, the motor (0 to 3 for ``motor1`` to ``motor4``, 4 and 5 for
+``stepper1`` and ``stepper2``), a direction or decay mode, a style, an integer and a float. The
+reply is ``<HBif``: the request id, a status (0 for success), an integer and a float. Replies to
+moves are sent when the move finishes, so they can arrive out of order. A `BATCH` request is
+followed by as many requests as its integer, at most `MAX_BATCH`, which are carried out together.
+The daemon replies to a `BATCH` request with a larger count with an error and disconnects.
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import socket
+import struct
+
+from adafruit_motorkit import _FAST_DECAY, _FORWARD, _SINGLE, MotorKit
+
+try:
+    from typing import List, Optional
+except ImportError:
+    pass
+
+DEFAULT_SOCKET = "/tmp/motorkit.sock"
+"""The path the daemon listens on unless another is given."""
+
+SET_THROTTLE = 1
+"""Sets the throttle of a DC motor to the float, or to ``None`` if it is NaN."""
+GET_THROTTLE = 2
+"""Replies with the throttle of a DC motor as the float, NaN for ``None``."""
+SET_DECAY = 3
+"""Sets the decay mode of a DC motor."""
+GET_DECAY = 4
+"""Replies with the decay mode of a DC motor as the integer."""
+ONESTEP = 5
+"""Makes one step of a stepper, replying with its position as the integer."""
+RELEASE = 6
+"""Releases a stepper."""
+MOVE = 7
+"""Moves a stepper the integer number of steps at the float rate, or as fast as possible if it
+is 0, replying with its position when the move is done."""
+BATCH = 8
+"""Carries out the following integer number of requests together."""
+MAX_BATCH = 16 * 6
+"""The most requests a `BATCH` can hold: 16 for each motor."""
+
+_REQUEST = struct.Struct("<HBBBBif")
+_REPLY = struct.Struct("<HBif")
+_NAMES = ("motor1", "motor2", "motor3", "motor4", "stepper1", "stepper2")
+# Exceptions by reply status. Anything else is reported as a RuntimeError.
+_ERRORS = (None, ValueError, RuntimeError)
+# Most requests a client sends before waiting for their replies.
+_WINDOW = 256
+
+
+def _status(error: Exception) -> int:
+    return 1 if isinstance(error, (ValueError, IndexError)) else 2
+
+
+class MotorKitServer:
+    """Serves a kit to clients connecting to a Unix domain socket.
+
+    :param MotorKit kit: The kit to serve
+    :param str path: Path of the socket. Default is `DEFAULT_SOCKET`.
+    """
+
+    def __init__(self, kit: MotorKit, path: str = DEFAULT_SOCKET) -> None:
+        self.kit = kit
+        """The kit being served."""
+        self.path = path
+        """Path of the socket."""
+
+    async def serve_forever(self) -> None:
+        """Listens for clients until cancelled, replacing any socket left at `path`."""
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = await asyncio.start_unix_server(self._serve, self.path)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+    def _handle(self, request: tuple, writer: asyncio.StreamWriter, moves: set) -> Optional[bytes]:
+        # Carries out one request and returns its reply, or None for a move, which replies once
+        # it is done.
+        ident, operation, target, mode, style, integer, value = request
+        try:
+            motor = getattr(self.kit, _NAMES[target])
+            if operation != MOVE:
+                return _REPLY.pack(ident, 0, *self._carry_out(motor, operation, mode, style, value))
+        except Exception as error:
+            return _REPLY.pack(ident, _status(error), 0, 0.0)
+        task = asyncio.ensure_future(
+            self._move(ident, motor, integer, mode, style, value or None, writer)
+        )
+        moves.add(task)
+        task.add_done_callback(moves.discard)
+        return None
+
+    @staticmethod
+    def _carry_out(motor, operation: int, mode: int, style: int, value: float) -> tuple:
+        if operation == SET_THROTTLE:
+            motor.throttle = None if math.isnan(value) else value
+        elif operation == SET_DECAY:
+            motor.decay_mode = mode
+        elif operation == RELEASE:
+            motor.release()
+        elif operation == GET_THROTTLE:
+            throttle = motor.throttle
+            return 0, math.nan if throttle is None else throttle
+        elif operation == GET_DECAY:
+            return motor.decay_mode, 0.0
+        elif operation == ONESTEP:
+            return motor.onestep(direction=mode, style=style), 0.0
+        else:
+            raise ValueError(f"Unknown operation {operation}")
+        return 0, 0.0
+
+    @staticmethod
+    async def _move(ident, motor, steps, direction, style, rate, writer) -> None:
+        try:
+            position = await motor.move_async(steps, direction=direction, style=style, rate=rate)
+            reply = _REPLY.pack(ident, 0, position, 0.0)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            reply = _REPLY.pack(ident, _status(error), 0, 0.0)
+        if not writer.is_closing():
+            writer.write(reply)
+
+    @staticmethod
+    def _requests(buffer: bytes) -> tuple:
+        # Returns the complete requests at the start of buffer, with any batch unwrapped, how many
+        # bytes they took, and the id of a batch with a bad count, which stops the parsing.
+        size = _REQUEST.size
+        requests = []
+        end = 0
+        while len(buffer) - end >= size:
+            request = _REQUEST.unpack_from(buffer, end)
+            if request[1] != BATCH:
+                requests.append(request)
+                end += size
+                continue
+            count = request[5]
+            if not 0 <= count <= MAX_BATCH:
+                return requests, end, request[0]
+            if len(buffer) - end < size * (count + 1):
+                # Wait for the rest of the batch.
+                break
+            requests.extend(
+                _REQUEST.unpack_from(buffer, end + size * i) for i in range(1, count + 1)
+            )
+            end += size * (count + 1)
+        return requests, end, None
+
+    async def _exchange(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, moves: set
+    ) -> None:
+        buffer = b""
+        while data := await reader.read(65536):
+            buffer += data
+            requests, end, rejected = self._requests(buffer)
+            buffer = buffer[end:]
+            # Everything that has arrived from this client is sent to the PCA9685 as one batch.
+            with self.kit._batcher:
+                replies = [self._handle(request, writer, moves) for request in requests]
+            if rejected is not None:
+                # What follows the bad batch cannot be told apart from requests, so stop reading.
+                replies.append(_REPLY.pack(rejected, 1, 0, 0.0))
+            writer.write(b"".join(reply for reply in replies if reply is not None))
+            await writer.drain()
+            if rejected is not None:
+                return
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        moves = set()
+        try:
+            await self._exchange(reader, writer, moves)
+        except ConnectionError:
+            pass
+        finally:
+            # Moves stop with the client that started them.
+            for task in list(moves):
+                task.cancel()
+            writer.close()
+
+
+class _RemoteDCMotor:
+    """A DC motor of a `MotorKitClient`, with the same API as `adafruit_motor.motor.DCMotor`."""
+
+    def __init__(self, client: "MotorKitClient", target: int) -> None:
+        self._client = client
+        self._target = target
+
+    @property
+    def throttle(self) -> Optional[float]:
+        """The motor speed, ranging from -1.0 (full speed reverse) to 1.0 (full speed forward),
+        or ``None`` (controller off)."""
+        value = self._client._call(GET_THROTTLE, self._target)[1]
+        return None if math.isnan(value) else value
+
+    @throttle.setter
+    def throttle(self, value: Optional[float]) -> None:
+        self._client._send(SET_THROTTLE, self._target, value=math.nan if value is None else value)
+
+    @property
+    def decay_mode(self) -> int:
+        """Motor controller recirculation mode, ``FAST_DECAY`` or ``SLOW_DECAY``."""
+        return self._client._call(GET_DECAY, self._target)[0]
+
+    @decay_mode.setter
+    def decay_mode(self, mode: int = _FAST_DECAY) -> None:
+        self._client._send(SET_DECAY, self._target, mode=mode)
+
+
+class _RemoteStepperMotor:
+    """A stepper of a `MotorKitClient`, with the same API as
+    `adafruit_motor.stepper.StepperMotor` and the kit's ``move``."""
+
+    def __init__(self, client: "MotorKitClient", target: int) -> None:
+        self._client = client
+        self._target = target
+
+    def onestep(self, *, direction: int = _FORWARD, style: int = _SINGLE) -> Optional[int]:
+        """Performs one step, returning the new position. Inside a `MotorKitClient.batch` the step
+        is only sent when the batch ends, so ``None`` is returned instead."""
+        if self._client._batch is not None:
+            self._client._send(ONESTEP, self._target, mode=direction, style=style)
+            return None
+        return self._client._call(ONESTEP, self._target, mode=direction, style=style)[0]
+
+    def release(self) -> None:
+        """Releases all the coils so the motor can free spin."""
+        self._client._send(RELEASE, self._target)
+
+    def move(
+        self,
+        steps: int,
+        *,
+        direction: int = _FORWARD,
+        style: int = _SINGLE,
+        rate: Optional[float] = None,
+    ) -> int:
+        """Takes ``steps`` steps at ``rate`` steps per second, or as fast as possible, returning
+        the new position once the move is done."""
+        return self._client._call(
+            MOVE, self._target, mode=direction, style=style, integer=steps, value=rate or 0.0
+        )[0]
+
+
+class _ClientBatch:
+    """Context manager that sends the requests made inside it together."""
+
+    def __init__(self, client: "MotorKitClient") -> None:
+        self._client = client
+
+    def __enter__(self) -> "MotorKitClient":
+        client = self._client
+        if client._batch is None:
+            client._batch = []
+            client._batch_depth = 0
+        client._batch_depth += 1
+        return client
+
+    def __exit__(self, *_) -> None:
+        client = self._client
+        client._batch_depth -= 1
+        if client._batch_depth:
+            return
+        requests = client._batch
+        client._batch = None
+        if len(requests) > MAX_BATCH:
+            for request in requests:
+                client._pending.discard(_REQUEST.unpack_from(request)[0])
+            raise ValueError(f"A batch can hold at most {MAX_BATCH} requests")
+        if requests:
+            header = _REQUEST.pack(client._next_id(), BATCH, 0, 0, 0, len(requests), 0.0)
+            client._socket.sendall(header + b"".join(requests))
+
+
+class MotorKitClient:
+    """A connection to a `MotorKitServer`, with the same motors as a
+    `adafruit_motorkit.MotorKit`.
+
+    Requests that do not return a value are sent without waiting for their reply, so they
+    pipeline; any error they raise is raised by the next call that waits for a reply, or by
+    `sync`. A client should only be used by one thread at a time.
+
+    :param str path: Path of the daemon's socket. Default is `DEFAULT_SOCKET`.
+    """
+
+    def __init__(self, path: str = DEFAULT_SOCKET) -> None:
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(path)
+        self._buffer = b""
+        self._id = 0
+        self._pending = set()
+        self._replies = {}
+        self._batch = None
+        self._batch_depth = 0
+        self._motors = [_RemoteDCMotor(self, target) for target in range(4)] + [
+            _RemoteStepperMotor(self, target) for target in (4, 5)
+        ]
+
+    def _next_id(self) -> int:
+        self._id = (self._id + 1) & 0xFFFF
+        return self._id
+
+    def _send(self, operation: int, target: int, *, mode=0, style=0, integer=0, value=0.0) -> int:
+        ident = self._next_id()
+        request = _REQUEST.pack(ident, operation, target, mode, style, integer, value)
+        if self._batch is not None:
+            self._batch.append(request)
+        else:
+            if len(self._pending) >= _WINDOW:
+                # Keeps the replies from filling the socket while the daemon waits to send them.
+                self.sync()
+            self._socket.sendall(request)
+        self._pending.add(ident)
+        return ident
+
+    def _receive(self) -> None:
+        # Reads replies until at least one more has arrived.
+        size = _REPLY.size
+        while len(self._buffer) < size:
+            data = self._socket.recv(65536)
+            if not data:
+                raise ConnectionError("The motor kit daemon closed the connection")
+            self._buffer += data
+        end = len(self._buffer) - len(self._buffer) % size
+        for offset in range(0, end, size):
+            ident, status, integer, value = _REPLY.unpack_from(self._buffer, offset)
+            self._replies[ident] = (status, integer, value)
+        self._buffer = self._buffer[end:]
+
+    def _wait(self, ident: int) -> tuple:
+        # Waits for the reply to ident, raising the error of any earlier request that failed.
+        while True:
+            for done in [done for done in self._replies if done != ident]:
+                status = self._replies.pop(done)[0]
+                self._pending.discard(done)
+                if status:
+                    raise _ERRORS[status](f"Request {done} to the motor kit daemon failed")
+            if ident in self._replies:
+                self._pending.discard(ident)
+                status, integer, value = self._replies.pop(ident)
+                if status:
+                    raise _ERRORS[status]("The motor kit daemon could not carry out the request")
+                return integer, value
+            self._receive()
+
+    def _call(self, operation: int, target: int, **kwargs) -> tuple:
+        if self._batch is not None:
+            raise RuntimeError("Values cannot be read inside a batch")
+        return self._wait(self._send(operation, target, **kwargs))
+
+    def sync(self) -> None:
+        """Waits for the reply to every request sent so far, raising the first error."""
+        while self._pending:
+            self._wait(next(iter(self._pending)))
+
+    def batch(self) -> _ClientBatch:
+        """Returns a context manager that sends the requests made inside it in one message, which
+        the daemon carries out as one `adafruit_motorkit.MotorKit.batch`. A batch can hold at most
+        `MAX_BATCH` requests."""
+        return _ClientBatch(self)
+
+    def close(self) -> None:
+        """Waits for outstanding replies and closes the connection."""
+        try:
+            self.sync()
+        finally:
+            self._socket.close()
+
+    def __enter__(self) -> "MotorKitClient":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @property
+    def motor1(self) -> _RemoteDCMotor:
+        """``motor1`` of the daemon's kit."""
+        return self._motors[0]
+
+    @property
+    def motor2(self) -> _RemoteDCMotor:
+        """``motor2`` of the daemon's kit."""
+        return self._motors[1]
+
+    @property
+    def motor3(self) -> _RemoteDCMotor:
+        """``motor3`` of the daemon's kit."""
+        return self._motors[2]
+
+    @property
+    def motor4(self) -> _RemoteDCMotor:
+        """``motor4`` of the daemon's kit."""
+        return self._motors[3]
+
+    @property
+    def stepper1(self) -> _RemoteStepperMotor:
+        """``stepper1`` of the daemon's kit."""
+        return self._motors[4]
+
+    @property
+    def stepper2(self) -> _RemoteStepperMotor:
+        """``stepper2`` of the daemon's kit."""
+        return self._motors[5]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Runs the daemon from the command line until interrupted."""
+    parser = argparse.ArgumentParser(prog="python -m adafruit_motorkit.daemon")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET, help="path to listen on")
+    parser.add_argument("--address", type=lambda text: int(text, 0), default=0x60)
+    parser.add_argument("--microsteps", type=int, default=16)
+    parser.add_argument("--pwm-frequency", type=float, default=1600.0)
+    parser.add_argument(
+        "--attach", action="store_true", help="take over a running PCA9685 without resetting it"
+    )
+    parser.add_argument("--simulate", action="store_true", help="use a simulated bus")
+    args = parser.parse_args(argv)
+    i2c = None
+    if args.simulate:
+        from adafruit_motorkit.simulator import SimulatedI2C
+
+        i2c = SimulatedI2C((args.address,))
+    kit = MotorKit(
+        args.address,
+        i2c=i2c,
+        steppers_microsteps=args.microsteps,
+        pwm_frequency=args.pwm_frequency,
+        attach=args.attach,
+    )
+    try:
+        asyncio.run(MotorKitServer(kit, args.socket).serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_motorkit.engine`
+====================================================
+
+Runs queued motor commands on a background thread so the caller never blocks while motors move.
+Only for use on Raspberry Pi or other SBC, since it needs `threading`.
+
+Each motor has its own queue and runs its commands in order. Commands on different motors run at
+the same time, and their updates that are due together are sent to the PCA9685 together. Timing
+uses absolute `time.monotonic_ns` deadlines, so late updates do not delay the ones after them.
+"""
+
+import math
+import threading
+import time
+
+from adafruit_motorkit import _BACKWARD, _FORWARD, _SINGLE, TRAPEZOIDAL, _DCMotor
+from adafruit_motorkit.acceleration import _ramp
+from adafruit_motorkit.group import _move_together, _slew
+from adafruit_motorkit.scheduler import _Motion, _tick
+
+try:
+    from typing import Any, Optional
+
+    from adafruit_motorkit import MotorKit
+except ImportError:
+    pass
+
+
+class Command:
+    """A queued motor command, returned by the `MotionEngine` methods."""
+
+    def __init__(self, engine: "MotionEngine", generator, lanes: tuple, total: int) -> None:
+        self._engine = engine
+        self._generator = generator
+        self._lanes = lanes
+        self._motion = None
+        # A pause of every motor queued before this command, which it must wait for.
+        self._after = None
+        self._event = threading.Event()
+        self._result = None
+        self._error = None
+        self.cancelled = False
+        """True once the command has been cancelled."""
+        self.count = 0
+        """Number of updates, such as steps, that have been made."""
+        self.total = max(1, total)
+        """Number of updates the command makes when it runs to completion."""
+
+    def _counted(self):
+        generator = self._generator
+        try:
+            while True:
+                deadline = next(generator)
+                self.count += 1
+                yield deadline
+        except StopIteration as stop:
+            self.count = self.total
+            return stop.value
+
+    @property
+    def started(self) -> bool:
+        """True once the command has made its first update."""
+        return self._motion is not None
+
+    @property
+    def done(self) -> bool:
+        """True once the command has finished, failed or been cancelled."""
+        return self._event.is_set()
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the command's updates that have been made, from 0.0 to 1.0."""
+        return min(1.0, self.count / self.total)
+
+    @property
+    def result(self) -> Any:
+        """What the command returned, such as the final position of a stepper move. Raises the
+        error the command failed with, if any."""
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until the command is done. Returns False if ``timeout`` seconds pass first."""
+        return self._event.wait(timeout)
+
+    def cancel(self) -> None:
+        """Stops the command, leaving its motor where it is. Cancelling a command that has not
+        started removes it from its queue."""
+        self._engine._cancel((self,))
+
+
+class MotionEngine:
+    """Runs queued commands for the motors of a `MotorKit` on a background thread. Use
+    `MotorKit.engine` rather than creating one directly.
+
+    The engine turns on the kit's ``thread_safe`` locking, so other motors can still be
+    controlled directly, from any thread. While the engine has commands for a motor, do not also
+    control that motor directly.
+
+    .. code-block:: python
+
+        from adafruit_motorkit import MotorKit
+
+        kit = MotorKit()
+
+        first = kit.engine.move(kit.stepper1, 200, rate=400, accel=1000)
+        kit.engine.move(kit.stepper1, -200, rate=400, accel=1000)
+        kit.engine.ramp(kit.motor3, 1.0, 2)
+        kit.engine.wait(1, kit.motor3)
+        kit.engine.throttle(kit.motor3, 0)
+
+        while not first.done:
+            print(first.progress)
+        kit.engine.join()
+
+    :param MotorKit kit: The kit whose motors the engine controls
+    """
+
+    def __init__(self, kit: MotorKit) -> None:
+        self._kit = kit
+        if kit._lock is None:
+            # The background thread writes to the kit too, so every batch must take the lock from
+            # now on. Batches this thread is already in take it as well, so that they release it.
+            lock = threading.RLock()
+            for _ in range(kit._batch_depth):
+                lock.acquire()
+            kit._lock = lock
+        self._condition = threading.Condition()
+        self._lanes = {}
+        self._changed = False
+        self._stopping = False
+        self._thread = None
+        # The last pause of every motor, which later commands on any motor wait for.
+        self._barrier = None
+
+    def _queue(self, generator, lanes: tuple, total: int, barrier: bool = False) -> Command:
+        with self._condition:
+            if self._stopping:
+                raise RuntimeError("The motion engine has been stopped")
+            if barrier:
+                lanes = tuple(self._lanes) or (None,)
+            command = Command(self, generator, lanes, total)
+            if self._barrier is not None and not self._barrier.done:
+                command._after = self._barrier
+            if barrier:
+                self._barrier = command
+            for lane in lanes:
+                self._lanes.setdefault(lane, []).append(command)
+            self._changed = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return command
+
+    def _cancel(self, commands) -> None:
+        with self._condition:
+            for command in commands:
+                if not command.done:
+                    command.cancelled = True
+            self._changed = True
+            self._condition.notify()
+
+    def _finish(self, command: Command) -> None:
+        # Called with the condition held.
+        for lane in command._lanes:
+            queue = self._lanes[lane]
+            queue.remove(command)
+            if not queue:
+                del self._lanes[lane]
+        command._generator.close()
+        command._event.set()
+        self._condition.notify_all()
+
+    def _update(self, running: list, active: list) -> bool:
+        # Called with the condition held. Drops finished and cancelled commands and starts every
+        # command that is now first in all of its lanes. Returns whether any command started.
+        for command in [command for command in running if command.cancelled]:
+            running.remove(command)
+            if command._motion in active:
+                active.remove(command._motion)
+            self._finish(command)
+        for command in [command for command in running if command._motion.done]:
+            running.remove(command)
+            command._result = command._motion.result
+            command._error = command._motion.error
+            self._finish(command)
+        for queue in list(self._lanes.values()):
+            for command in [command for command in queue if command.cancelled]:
+                if not command.done:
+                    self._finish(command)
+        started = False
+        for queue in self._lanes.values():
+            command = queue[0]
+            if (
+                command._motion is None
+                and (command._after is None or command._after.done)
+                and all(self._lanes[lane][0] is command for lane in command._lanes)
+            ):
+                command._motion = _Motion(command._counted(), None)
+                running.append(command)
+                active.append(command._motion)
+                started = True
+        return started
+
+    def _run(self) -> None:
+        kit = self._kit
+        condition = self._condition
+        running = []
+        active = []
+        earliest = None
+        while True:
+            with condition:
+                started = self._update(running, active)
+                if self._stopping:
+                    for command in running:
+                        self._finish(command)
+                    self._thread = None
+                    return
+                if not active:
+                    while not self._changed and not self._stopping:
+                        condition.wait()
+                    self._changed = False
+                    continue
+                if not started and not self._changed and earliest is not None:
+                    delay = earliest - time.monotonic_ns()
+                    if delay > 0:
+                        condition.wait(delay / 1_000_000_000)
+                        continue
+                self._changed = False
+            earliest = _tick(kit, active)
+
+    def move(
+        self,
+        stepper: Any,
+        steps: int,
+        *,
+        direction: int = _FORWARD,
+        style: int = _SINGLE,
+        rate: Optional[float] = None,
+        accel: Optional[float] = None,
+        profile: int = TRAPEZOIDAL,
+    ) -> Command:
+        """Queues a stepper move. Takes the same arguments as the stepper's ``move``, except that
+        ``steps`` can be negative to move ``BACKWARD``."""
+        if steps < 0:
+            steps = -steps
+            direction = _BACKWARD if direction == _FORWARD else _FORWARD
+        if accel:
+            _ramp(rate, accel, profile)
+        generator = stepper._move(steps, direction, style, rate, accel, profile)
+        return self._queue(generator, (stepper,), steps)
+
+    def move_together(
+        self,
+        steps1: int,
+        steps2: int,
+        *,
+        style: int = _SINGLE,
+        rate: Optional[float] = None,
+        accel: Optional[float] = None,
+        profile: int = TRAPEZOIDAL,
+    ) -> Command:
+        """Queues a `MotorKit.move_together` move. It starts once both steppers have finished
+        their earlier commands."""
+        if accel:
+            _ramp(rate, accel, profile)
+        kit = self._kit
+        generator = _move_together(kit, steps1, steps2, style, rate, accel, profile)
+        return self._queue(generator, (kit.stepper1, kit.stepper2), max(abs(steps1), abs(steps2)))
+
+    def throttle(self, motor: Any, value: Optional[float]) -> Command:
+        """Queues a change of a DC motor's throttle."""
+        if not isinstance(motor, _DCMotor):
+            raise ValueError("Only a DC motor has a throttle")
+        if value is not None and not -1.0 <= value <= 1.0:
+            raise ValueError("Throttle must be None or between -1.0 and +1.0")
+        return self._queue(_set_throttle(motor, value), (motor,), 1)
+
+    def ramp(self, motor: Any, target: float, seconds: float, *, rate: float = 50.0) -> Command:
+        """Queues a linear change of a DC motor's throttle to ``target`` over ``seconds``."""
+        if not isinstance(motor, _DCMotor):
+            raise ValueError("Only a DC motor has a throttle")
+        return self._queue(motor._ramp(target, seconds, rate), (motor,), int(seconds * rate))
+
+    def slew(self, targets: dict, slew_rate: float, *, rate: float = 50.0) -> Command:
+        """Queues a `MotorKit.slew` of several DC motors. It starts once all of them have
+        finished their earlier commands."""
+        kit = self._kit
+        generator = _slew(kit, targets, slew_rate, rate)
+        motors = tuple(getattr(kit, name) for name in targets)
+        # Estimated from the current throttles; earlier commands may change them.
+        change = max(
+            (
+                abs(target - (motor.throttle or 0.0))
+                for motor, target in zip(motors, targets.values())
+            ),
+            default=0,
+        )
+        return self._queue(generator, motors or (None,), math.ceil(change * rate / slew_rate))
+
+    def wait(self, seconds: float, *motors: Any) -> Command:
+        """Queues a pause. The following commands for each of ``motors`` start ``seconds`` after
+        their earlier commands have all finished. If no motors are given, the pause is for every
+        motor: it starts once every earlier command has finished, and no later command starts
+        until it is over."""
+        return self._queue(_pause(seconds), motors, 1, not motors)
+
+    def cancel(self, *motors: Any) -> None:
+        """Cancels the queued and running commands of ``motors``, or of every motor if none are
+        given. The motors stay where they are."""
+        with self._condition:
+            commands = [
+                command
+                for lane, queue in self._lanes.items()
+                if not motors or lane in motors
+                for command in queue
+            ]
+        self._cancel(commands)
+
+    @property
+    def idle(self) -> bool:
+        """True when no commands are queued or running."""
+        with self._condition:
+            return not self._lanes
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until every queued command is done. Returns False if ``timeout`` seconds pass
+        first."""
+        end = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._lanes:
+                remaining = None if end is None else end - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def stop(self) -> None:
+        """Cancels every command and stops the background thread. `MotorKit.engine` then creates
+        a new engine."""
+        self.cancel()
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+            thread = self._thread
+        kit = self._kit
+        with kit._batcher:
+            if kit._engine is self:
+                kit._engine = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+
+def _set_throttle(motor: Any, value: Optional[float]):
+    motor.throttle = value
+    yield from ()
+
+
+def _pause(seconds: float):
+    yield time.monotonic_ns() + int(seconds * 1_000_000_000)
@@ -0,0 +1,208 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_motorkit.group`
+====================================================
+
+The motions behind `adafruit_motorkit.MotorKit.move_together`, `adafruit_motorkit.MotorKit.slew`
+and `adafruit_motorkit.MotorKit.play`, which drive several of a kit's motors together. They are
+imported on first use, so the core library stays small on microcontrollers.
+"""
+
+import time
+
+from micropython import const
+
+from adafruit_motorkit import TRAPEZOIDAL, _deadlines, _span
+
+try:
+    from typing import Optional
+
+    from adafruit_motorkit import MotorKit
+except ImportError:
+    pass
+
+# Values match the constants in adafruit_motor.stepper so either set can be passed in.
+_FORWARD = const(1)
+_BACKWARD = const(2)
+_SINGLE = const(1)
+
+
+def _read_ahead(frames, size: int):
+    """Yields the items of ``frames``. Where `threading` is available, up to ``size`` items are
+    produced ahead on a background thread, so producing them overlaps with the caller's waits."""
+    try:
+        import queue
+        import threading
+    except ImportError:
+        yield from frames
+        return
+    if size < 1:
+        yield from frames
+        return
+    items = queue.Queue(size)
+    stopping = threading.Event()
+    end = object()
+
+    def put(item) -> bool:
+        while not stopping.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce() -> None:
+        try:
+            for frame in frames:
+                if not put((frame, None)):
+                    return
+        except Exception as error:
+            put((end, error))
+            return
+        put((end, None))
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            frame, error = items.get()
+            if frame is end:
+                if error is not None:
+                    raise error
+                return
+            yield frame
+    finally:
+        stopping.set()
+
+
+def _move_together(
+    kit: MotorKit,
+    steps1: int,
+    steps2: int,
+    style: int,
+    rate: Optional[float],
+    accel: Optional[float] = None,
+    profile: int = TRAPEZOIDAL,
+):
+    if accel:
+        from adafruit_motorkit.acceleration import _ramp
+
+        ramp = _ramp(rate, accel, profile)
+    else:
+        ramp = None
+    stepper1 = kit.stepper1
+    stepper2 = kit.stepper2
+    count1 = abs(steps1)
+    count2 = abs(steps2)
+    ticks = max(count1, count2)
+    # Each stepper's own move does the stepping; this only decides which tick each step is in.
+    move1 = stepper1._move(count1, _FORWARD if steps1 >= 0 else _BACKWARD, style, None)
+    move2 = stepper2._move(count2, _FORWARD if steps2 >= 0 else _BACKWARD, style, None)
+    # Both steppers' coil channels, and any between them, go out as one write on each tick.
+    span = _span(
+        (stepper1._channel, stepper1._channel + 3, stepper2._channel, stepper2._channel + 3)
+    )
+    batcher = kit._batcher
+    error1 = error2 = ticks // 2
+    deadlines = _deadlines(ticks, rate, ramp)
+    for tick in range(ticks):
+        if tick:
+            yield next(deadlines)
+        with batcher:
+            kit._joined |= span
+            error1 += count1
+            if error1 >= ticks:
+                error1 -= ticks
+                next(move1, None)
+            error2 += count2
+            if error2 >= ticks:
+                error2 -= ticks
+                next(move2, None)
+    return stepper1._current_microstep, stepper2._current_microstep
+
+
+def _slew(kit: MotorKit, targets: dict, slew_rate: float, rate: float = 50.0):
+    # Checks the arguments straight away and returns the generator that does the slewing.
+    if slew_rate <= 0:
+        raise ValueError("Slew rate must be positive")
+    if rate <= 0:
+        raise ValueError("Rate must be positive")
+    motors = []
+    for name, target in targets.items():
+        if name not in {"motor1", "motor2", "motor3", "motor4"}:
+            raise ValueError(f"Unknown DC motor {name!r}")
+        if target is None or target > 1.0 or target < -1.0:
+            raise ValueError("Throttle must be between -1.0 and +1.0")
+        motors.append((getattr(kit, name), target))
+    return _slewing(kit, motors, slew_rate / rate, int(1_000_000_000 / rate))
+
+
+def _slewing(kit: MotorKit, motors: list, step: float, interval: int):
+    if not motors:
+        return
+    ramps = [[motor, motor.throttle or 0.0, target] for motor, target in motors]
+    deadline = time.monotonic_ns()
+    batcher = kit._batcher
+    while True:
+        ramping = False
+        with batcher:
+            for ramp in ramps:
+                motor, value, target = ramp
+                if value == target:
+                    continue
+                if abs(target - value) <= step:
+                    value = target
+                else:
+                    value += step if target > value else -step
+                    ramping = True
+                ramp[1] = value
+                motor.throttle = value
+        if not ramping:
+            return
+        deadline += interval
+        yield deadline
+
+
+def _play(kit: MotorKit, frames, rate: float, style: int = _SINGLE, buffer: int = 16):
+    if rate <= 0:
+        raise ValueError("Rate must be positive")
+    interval = int(1_000_000_000 / rate)
+    motors = {}
+    batcher = kit._batcher
+    count = 0
+    deadline = 0
+    for frame in _read_ahead(frames, buffer):
+        if count:
+            deadline += interval
+            yield deadline
+        else:
+            deadline = time.monotonic_ns()
+        count += 1
+        items = []
+        for name, state in frame.items():
+            if name not in motors:
+                if name not in {"motor1", "motor2", "motor3", "motor4", "stepper1", "stepper2"}:
+                    raise ValueError(f"Unknown motor {name!r}")
+                motors[name] = getattr(kit, name)
+            value = state
+            if name[0] == "s":
+                # Frames from NumPy or JSON can hold steps as floats.
+                value = int(state)
+                if value != state:
+                    raise ValueError(f"Steps for {name} must be a whole number, not {state!r}")
+            items.append((name, value))
+            if name[0] == "s" and not -1 <= value <= 1:
+                direction = _FORWARD if value > 0 else _BACKWARD
+                for _ in range(abs(value) - 1):
+                    motors[name].onestep(direction=direction, style=style)
+        with batcher:
+            for name, value in items:
+                if name[0] == "m":
+                    motors[name].throttle = value
+                elif value:
+                    direction = _FORWARD if value > 0 else _BACKWARD
+                    motors[name].onestep(direction=direction, style=style)
+    return count
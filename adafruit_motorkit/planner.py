@@ -0,0 +1,346 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_motorkit.planner`
+====================================================
+
+Runs jobs written in a small G-code like language on ``stepper1`` (X) and ``stepper2`` (Y) of a
+`adafruit_motorkit.MotorKit`. Moves are planned ahead: the speed at each junction between
+consecutive moves is set by how sharply the path turns there, so a path made of many short moves
+is followed without stopping at every one of them.
+
+Supported commands, one or more per line:
+
+* ``G0`` and ``G1`` with ``X``, ``Y`` and ``F``: a straight move, at the maximum speed for ``G0``
+  or at the feed rate ``F`` in units per minute for ``G1``. ``F`` carries over to later moves.
+  ``X`` or ``Y`` on a line without ``G0``, ``G1`` or ``G92`` moves as the last ``G0`` or ``G1``
+  did, or as ``G1`` before either has been used, after the line's other ``G`` commands and before
+  its ``M`` commands.
+* ``G4`` with ``P`` in milliseconds or ``S`` in seconds: dwell, after coming to a stop.
+* ``G90`` and ``G91``: absolute and relative coordinates.
+* ``G92`` with ``X`` and ``Y``: set the current position without moving.
+* ``M17``: energize the steppers. ``M18`` or ``M84``: release them, after coming to a stop.
+* ``M2`` or ``M30``: end of the job.
+
+Comments in parentheses or after ``;`` and ``N`` line numbers are ignored.
+
+.. code-block:: python
+
+    from adafruit_motorkit import MotorKit
+    from adafruit_motorkit.planner import Planner
+
+    kit = MotorKit()
+    planner = Planner(kit, steps_per_unit=(20, 20), accel=500)
+
+    with open("job.gcode") as job:
+        planner.run(job)
+"""
+
+import math
+import re
+import time
+
+from adafruit_motorkit import _BACKWARD, _FORWARD, _MICROSTEP, _SINGLE
+
+try:
+    from typing import Iterable, List, Optional, Tuple, Union
+
+    from adafruit_motorkit import MotorKit
+except ImportError:
+    pass
+
+_WORD = re.compile(r"([A-Z])\s*([-+]?(?:\d+\.?\d*|\.\d+))")
+_COMMENT = re.compile(r"\(.*?\)|;.*")
+
+
+class _Block:
+    """One straight move, with its speeds in units per second."""
+
+    __slots__ = ("entry", "length", "max_entry", "nominal", "steps")
+
+    def __init__(self, steps: Tuple[int, int], length: float, nominal: float) -> None:
+        self.steps = steps
+        self.length = length
+        self.nominal = nominal
+        self.max_entry = 0.0
+        self.entry = 0.0
+
+
+def _time_at(distance: float, entry: float, peak: float, exit_: float, accel: float, length: float):
+    # Seconds after the start of a move that it has covered distance, speeding up from entry to
+    # peak, cruising and slowing down to exit.
+    accelerating = (peak * peak - entry * entry) / (2 * accel)
+    decelerating = (peak * peak - exit_ * exit_) / (2 * accel)
+    if distance <= accelerating:
+        return (math.sqrt(entry * entry + 2 * accel * distance) - entry) / accel
+    cruising = length - accelerating - decelerating
+    elapsed = (peak - entry) / accel
+    if distance <= accelerating + cruising:
+        return elapsed + (distance - accelerating) / peak
+    remaining = distance - accelerating - cruising
+    speed = math.sqrt(max(peak * peak - 2 * accel * remaining, 0.0))
+    return elapsed + cruising / peak + (peak - speed) / accel
+
+
+class Planner:
+    """Plans and runs G-code like jobs on the two steppers of a kit. See the module description
+    for the commands.
+
+    :param MotorKit kit: The kit with the steppers
+    :param tuple steps_per_unit: Steps of ``style`` per unit of X and of Y. Default is
+      ``(1, 1)``, which works in steps.
+    :param float accel: Acceleration along the path in units per second per second. Default is
+      100.
+    :param float max_rate: Most steps per second either stepper may make, which also sets the
+      speed of ``G0``. Default is 1000.
+    :param float junction_deviation: How far, in units, the path may be thought of as cutting a
+      corner when working out the speed to take it at. Larger values take corners faster. Default
+      is 0.05.
+    :param int style: ``SINGLE``, ``DOUBLE``, ``INTERLEAVE`` or ``MICROSTEP``, for every step
+    :param int lookahead: Number of moves planned ahead. Default is 16.
+    """
+
+    def __init__(
+        self,
+        kit: MotorKit,
+        *,
+        steps_per_unit: Tuple[float, float] = (1.0, 1.0),
+        accel: float = 100.0,
+        max_rate: float = 1000.0,
+        junction_deviation: float = 0.05,
+        style: int = _SINGLE,
+        lookahead: int = 16,
+    ) -> None:
+        if accel <= 0 or max_rate <= 0:
+            raise ValueError("Acceleration and maximum rate must be positive")
+        if lookahead < 1:
+            raise ValueError("Look ahead must be at least one move")
+        self._kit = kit
+        self._steppers = (kit.stepper1, kit.stepper2)
+        self.steps_per_unit = tuple(steps_per_unit)
+        """Steps of `style` per unit of X and of Y."""
+        self.accel = accel
+        """Acceleration along the path in units per second per second."""
+        self.max_rate = max_rate
+        """Most steps per second either stepper may make."""
+        self.junction_deviation = junction_deviation
+        """How sharply corners may be taken; larger is faster."""
+        self.style = style
+        """The stepping style of every step."""
+        self.lookahead = lookahead
+        """Number of moves planned ahead."""
+        self.feed = None
+        """The current feed rate in units per minute, set by ``F``. ``None`` moves at the
+        maximum speed until a feed rate is given."""
+        self.relative = False
+        """Whether coordinates are relative, set by ``G91`` and cleared by ``G90``."""
+        self.rapid = False
+        """Whether moves without ``G0`` or ``G1`` are at the maximum speed, set by ``G0`` and
+        cleared by ``G1``."""
+        self._position = [0.0, 0.0]
+        self._offset = [0.0, 0.0]
+        self._steps = [0, 0]
+        # Direction and speed of the last move, for working out the junction speed of the next.
+        self._direction = None
+        self._nominal = 0.0
+
+    @property
+    def position(self) -> Tuple[float, float]:
+        """The X and Y position at the end of the moves read so far, in units."""
+        return tuple(self._position)
+
+    def run(self, lines: Union[str, Iterable[str]]) -> Tuple[float, float]:
+        """Runs a job, returning when it is done. Returns the final position.
+
+        :param lines: The job, as a string or an iterable of lines such as an open file. Lines are
+          read as they are needed, so the job can be of any length.
+        """
+        return self._kit._run(self._execute(lines))
+
+    async def run_async(self, lines: Union[str, Iterable[str]]) -> Tuple[float, float]:
+        """Same as `run` but without blocking the event loop."""
+        return await self._kit._run_async(self._execute(lines))
+
+    def _commands(self, lines: Union[str, Iterable[str]]):
+        # Yields a _Block for each move, and the name and value of every other command.
+        if isinstance(lines, str):
+            lines = lines.splitlines()
+        for number, line in enumerate(lines, 1):
+            text = _COMMENT.sub("", line).upper()
+            words = _WORD.findall(text)
+            if text.strip() and not words:
+                raise ValueError(f"Line {number}: cannot read {line.strip()!r}")
+            values = {}
+            commands = []
+            for letter, value in words:
+                if letter in "GM":
+                    commands.append(letter + str(int(float(value))))
+                elif letter != "N":
+                    values[letter] = float(value)
+            if "F" in values:
+                if values["F"] <= 0:
+                    raise ValueError(f"Line {number}: the feed rate must be positive")
+                self.feed = values["F"]
+            if ("X" in values or "Y" in values) and not {"G0", "G1", "G92"} & set(commands):
+                # A move in the last motion mode, after the line's G commands.
+                index = next(
+                    (i for i, command in enumerate(commands) if command[0] == "M"), len(commands)
+                )
+                commands.insert(index, "G0" if self.rapid else "G1")
+            for command in commands:
+                if command in {"G0", "G1"}:
+                    self.rapid = command == "G0"
+                    block = self._move(values, self.rapid)
+                    if block is not None:
+                        yield block
+                elif command == "G4":
+                    yield "dwell", values.get("P", 0.0) / 1000 + values.get("S", 0.0)
+                elif command == "G90":
+                    self.relative = False
+                elif command == "G91":
+                    self.relative = True
+                elif command == "G92":
+                    for axis, letter in enumerate("XY"):
+                        if letter in values:
+                            self._offset[axis] += self._position[axis] - values[letter]
+                            self._position[axis] = values[letter]
+                elif command in {"M17", "M18", "M84"}:
+                    yield command, None
+                elif command in {"M2", "M30"}:
+                    return
+                else:
+                    raise ValueError(f"Line {number}: unsupported command {command}")
+
+    def _move(self, values: dict, rapid: bool) -> Optional[_Block]:
+        target = list(self._position)
+        for axis, letter in enumerate("XY"):
+            if letter in values:
+                target[axis] = target[axis] + values[letter] if self.relative else values[letter]
+        self._position = target
+        # Steps are counted from the origin, so rounding never accumulates.
+        steps = [
+            round((target[axis] + self._offset[axis]) * self.steps_per_unit[axis])
+            for axis in (0, 1)
+        ]
+        delta = (steps[0] - self._steps[0], steps[1] - self._steps[1])
+        self._steps = steps
+        if delta == (0, 0):
+            return None
+        distance = (delta[0] / self.steps_per_unit[0], delta[1] / self.steps_per_unit[1])
+        length = math.hypot(*distance)
+        # The stepper with more steps takes one on every tick, and sets the highest speed.
+        nominal = self.max_rate * length / max(abs(delta[0]), abs(delta[1]))
+        if not rapid and self.feed is not None:
+            nominal = min(nominal, self.feed / 60)
+        block = _Block(delta, length, nominal)
+        direction = (distance[0] / length, distance[1] / length)
+        if self._direction is not None:
+            block.max_entry = min(
+                self._junction(self._direction, direction), nominal, self._nominal
+            )
+        self._direction = direction
+        self._nominal = nominal
+        return block
+
+    def _junction(self, before: Tuple[float, float], after: Tuple[float, float]) -> float:
+        # The speed at which a circle that deviates junction_deviation from the corner can be
+        # followed at the acceleration limit.
+        cosine = -(before[0] * after[0] + before[1] * after[1])
+        if cosine > 0.999999:
+            return 0.0
+        if cosine < -0.999999:
+            return math.inf
+        sine = math.sqrt(0.5 * (1.0 - cosine))
+        return math.sqrt(self.accel * self.junction_deviation * sine / (1.0 - sine))
+
+    def _plan(self, queue: List[_Block]) -> None:
+        # Sets the entry speed of every queued move after the first, whose entry speed is already
+        # fixed, so that every move can still be stopped by the end of the last one.
+        accel2 = 2 * self.accel
+        following = 0.0
+        for block in reversed(queue[1:]):
+            block.entry = min(
+                block.max_entry, math.sqrt(following * following + accel2 * block.length)
+            )
+            following = block.entry
+        for previous, block in zip(queue, queue[1:]):
+            reachable = math.sqrt(previous.entry * previous.entry + accel2 * previous.length)
+            block.entry = min(block.entry, reachable)
+
+    def _execute(self, lines: Union[str, Iterable[str]]):
+        queue = []
+        end = None
+        for command in self._commands(lines):
+            if isinstance(command, _Block):
+                if not queue:
+                    # Starting from a stop.
+                    command.max_entry = 0.0
+                queue.append(command)
+                self._plan(queue)
+                if len(queue) > self.lookahead:
+                    block = queue.pop(0)
+                    end = yield from self._trace(block, queue[0].entry, end)
+                continue
+            yield from self._drain(queue, end)
+            name, value = command
+            if name == "dwell":
+                yield time.monotonic_ns() + int(value * 1_000_000_000)
+            elif name == "M17":
+                with self._kit._batcher:
+                    for stepper in self._steppers:
+                        stepper._update_coils(microstepping=self.style == _MICROSTEP)
+            else:
+                with self._kit._batcher:
+                    for stepper in self._steppers:
+                        stepper.release()
+            end = None
+        yield from self._drain(queue, end)
+        return self.position
+
+    def _drain(self, queue: List[_Block], end: Optional[int]):
+        # Runs every queued move, coming to a stop at the end of the last.
+        while queue:
+            block = queue.pop(0)
+            end = yield from self._trace(block, queue[0].entry if queue else 0.0, end)
+        self._direction = None
+
+    def _deadlines(self, block: _Block, exit_: float, start: int):
+        # Yields the time of each tick of a move, speeding up from its entry speed to at most its
+        # nominal speed and slowing down to exit_.
+        accel = self.accel
+        length = block.length
+        entry = block.entry
+        peak = min(block.nominal, math.sqrt((2 * accel * length + entry**2 + exit_**2) / 2))
+        ticks = max(abs(block.steps[0]), abs(block.steps[1]))
+        for tick in range(1, ticks + 1):
+            distance = tick * length / ticks
+            yield start + int(_time_at(distance, entry, peak, exit_, accel, length) * 1_000_000_000)
+
+    def _trace(self, block: _Block, exit_: float, start: Optional[int]):
+        # Steps along one move, like MotorKit.move_together, and returns the time of its last step.
+        count1, count2 = abs(block.steps[0]), abs(block.steps[1])
+        ticks = max(count1, count2)
+        stepper1, stepper2 = self._steppers
+        direction1 = _FORWARD if block.steps[0] >= 0 else _BACKWARD
+        direction2 = _FORWARD if block.steps[1] >= 0 else _BACKWARD
+        move1 = stepper1._move(count1, direction1, self.style, None)
+        move2 = stepper2._move(count2, direction2, self.style, None)
+        batcher = self._kit._batcher
+        error1 = error2 = ticks // 2
+        if start is None:
+            start = time.monotonic_ns()
+        deadline = start
+        for deadline in self._deadlines(block, exit_, start):
+            yield deadline
+            with batcher:
+                error1 += count1
+                if error1 >= ticks:
+                    error1 -= ticks
+                    next(move1, None)
+                error2 += count2
+                if error2 >= ticks:
+                    error2 -= ticks
+                    next(move2, None)
+        return deadline
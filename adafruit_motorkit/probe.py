@@ -0,0 +1,203 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_motorkit.probe`
+====================================================
+
+Measures the step and update rates a `adafruit_motorkit.MotorKit` can sustain on its bus, for
+`adafruit_motorkit.MotorKit.probe_throughput`. Nothing moves while it runs: the probe steps and
+drives the M1 and M2 terminals with their driver enable pins turned off, and then puts every
+channel back as it was.
+"""
+
+import time
+
+from adafruit_motorkit import (
+    _DOUBLE,
+    _FORWARD,
+    _INTERLEAVE,
+    _LED0_ON_L,
+    _MICROSTEP,
+    _RELEASED,
+    _SINGLE,
+    _DCMotor,
+    _load_frame,
+    _step_frames,
+    _StepperMotor,
+)
+
+try:
+    from typing import List
+
+    from adafruit_motorkit import MotorKit
+except ImportError:
+    pass
+
+ADVISED_FREQUENCIES = (100_000, 400_000, 1_000_000)
+"""The bus clocks, in Hertz, that `probe` projects step rates at."""
+
+_STYLES = (
+    ("SINGLE", _SINGLE),
+    ("DOUBLE", _DOUBLE),
+    ("INTERLEAVE", _INTERLEAVE),
+    ("MICROSTEP", _MICROSTEP),
+)
+
+
+def _percentile(samples: List[int], fraction: float) -> int:
+    ordered = sorted(samples)
+    return ordered[int(fraction * (len(ordered) - 1))]
+
+
+def _step_bytes(microsteps: int, style: int) -> float:
+    # Average bytes on the bus per step of a style: each step is one write, from the first to the
+    # last byte that changed, plus the address and register bytes. Full on and full off leave the
+    # other bytes of a channel as they were, so the steps of the first cycle settle the registers
+    # and only the second cycle is counted.
+    frames = _step_frames(microsteps, style == _MICROSTEP)
+    if style == _MICROSTEP:
+        size = 1
+    elif style == _INTERLEAVE:
+        size = microsteps // 2
+    else:
+        size = microsteps
+    # DOUBLE steps are between the positions of SINGLE steps.
+    first = microsteps // 2 if style == _DOUBLE else 0
+    positions = range(first, first + 4 * microsteps, size)
+    regs = bytearray(17)
+    _load_frame(regs, 1, frames[16 * first : 16 * first + 16])
+    total = 0
+    for cycle in range(2):
+        for position in positions:
+            new = 16 * ((position + size) % (4 * microsteps))
+            old = bytes(regs)
+            _load_frame(regs, 1, frames[new : new + 16])
+            if not cycle:
+                continue
+            changed = [i for i in range(1, 17) if regs[i] != old[i]]
+            if changed:
+                total += 2 + changed[-1] - changed[0] + 1
+    return total / len(positions)
+
+
+def _time(action, iterations: int) -> List[int]:
+    # Nanoseconds taken by each of iterations calls of action, which is passed the iteration.
+    monotonic_ns = time.monotonic_ns
+    samples = []
+    for i in range(iterations):
+        start = monotonic_ns()
+        action(i)
+        samples.append(monotonic_ns() - start)
+    return samples
+
+
+def _bus(kit: MotorKit, owned: int, iterations: int) -> dict:
+    # Rewriting registers with the values they already hold changes nothing, so the bus can be
+    # timed with writes of one channel and of the longest run of channels that are either known
+    # or ``owned`` by the probe, which puts them back when it is done. Other channels may be
+    # running a motor and are never written.
+    safe = kit._known | owned
+    first = count = 0
+    index = 0
+    while index < 16:
+        if safe >> index & 1:
+            start = index
+            while index < 16 and safe >> index & 1:
+                index += 1
+            if index - start > count:
+                first, count = start, index - start
+        index += 1
+    hardware = kit._hardware
+    image = bytearray(65)
+    for index in range(first, first + count):
+        offset = 4 * index + 1
+        if kit._known >> index & 1:
+            image[offset : offset + 4] = hardware[offset : offset + 4]
+        else:
+            image[offset : offset + 4] = _RELEASED[:4]
+    offset = 4 * first
+    image[offset] = _LED0_ON_L + offset
+    typical = {}
+    with kit._pca.i2c_device as i2c:
+        for channels in sorted({1, count}):
+            end = offset + 4 * channels + 1
+            samples = _time(lambda _, end=end: i2c.write(image, start=offset, end=end), iterations)
+            typical[channels] = _percentile(samples, 0.5)
+    # Each extra channel is four more bytes of nine clocks each. Faster than a 5 MHz clock, which
+    # no PCA9685 bus runs at, the difference is just Python copying the bytes.
+    per_byte = (typical[count] - typical[1]) / (4 * (count - 1)) if count > 1 else 0
+    return {
+        "bus_frequency": round(9_000_000_000 / per_byte) if per_byte > 1800 else None,
+        "transaction_us": {channels: sample / 1000 for channels, sample in typical.items()},
+    }
+
+
+def _steps(kit: MotorKit, channel: int, frequency: int, iterations: int) -> dict:
+    microsteps = kit._steppers_microsteps
+    stepper = _StepperMotor(kit, channel, microsteps)
+    results = {}
+    for name, style in _STYLES:
+        stepper.onestep(direction=_FORWARD, style=style)
+        samples = _time(
+            lambda _, style=style: stepper.onestep(direction=_FORWARD, style=style), iterations
+        )
+        typical = _percentile(samples, 0.5)
+        step_bytes = _step_bytes(microsteps, style)
+        result = {
+            "step_us": typical / 1000,
+            "max_step_rate": 1_000_000_000 / _percentile(samples, 0.99),
+            "bytes_per_step": step_bytes,
+        }
+        if frequency:
+            # What the same steps would cost with the bus clocked at each frequency.
+            python = max(typical - step_bytes * 9_000_000_000 / frequency, 0)
+            result["projected_step_rate"] = {
+                advised: 1_000_000_000 / (python + step_bytes * 9_000_000_000 / advised)
+                for advised in ADVISED_FREQUENCIES
+            }
+        results[name] = result
+    return results
+
+
+def probe(kit: MotorKit, iterations: int = 200) -> dict:
+    """Runs the probe on ``kit``. See `adafruit_motorkit.MotorKit.probe_throughput`."""
+    kit._connect()
+    enable, positive, negative = kit._wiring[0]
+    second = kit._wiring[1]
+    touched = 0
+    for index in (enable, positive, negative) + second:
+        touched |= 1 << index
+    with kit._batcher:
+        saved = bytes(kit._regs)
+        stats = kit._stats
+        kit._stats = None
+    try:
+        kit._write(enable, 0)
+        kit._write(second[0], 0)
+        results = _bus(kit, touched, iterations)
+        motor = _DCMotor(kit, positive, negative)
+        dc = _time(lambda i: setattr(motor, "throttle", 0.5 if i % 2 else -0.5), iterations)
+        results["dc"] = {
+            "update_us": _percentile(dc, 0.5) / 1000,
+            "max_update_rate": 1_000_000_000 / _percentile(dc, 0.99),
+        }
+        results["steps"] = {}
+        if (negative, second[1], second[2]) == (positive + 1, positive + 2, positive + 3):
+            results["steps"] = _steps(kit, positive, results["bus_frequency"], iterations)
+    finally:
+        with kit._batcher:
+            regs = kit._regs
+            for index in range(16):
+                if touched >> index & 1:
+                    offset = 4 * index + 1
+                    if any(saved[offset : offset + 4]):
+                        regs[offset : offset + 4] = saved[offset : offset + 4]
+                    else:
+                        # Channels the kit never wrote are still in their reset state.
+                        regs[offset : offset + 4] = _RELEASED[:4]
+                    kit._valid &= ~(1 << index)
+                    kit._dirty |= 1 << index
+        kit._stats = stats
+    return results
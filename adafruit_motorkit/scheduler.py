@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_motorkit.scheduler`
+====================================================
+
+The asyncio task behind the ``_async`` methods of `adafruit_motorkit.MotorKit` and its motors.
+Each kit has at most one, created by the first of them that is awaited, which drives every
+motion of the kit and sends the updates that are due at the same time together.
+"""
+
+import time
+
+from micropython import const
+
+try:
+    from typing import Optional
+
+    from adafruit_motorkit import MotorKit
+except ImportError:
+    pass
+
+# Motion updates due within this many nanoseconds of each other are sent together.
+_TICK_NS = const(500_000)
+
+
+class _Motion:
+    """A generator that updates motors and yields the `time.monotonic_ns` deadline of its next
+    update, along with the state needed to await it."""
+
+    __slots__ = ("deadline", "done", "error", "event", "generator", "result")
+
+    def __init__(self, generator, event) -> None:
+        self.generator = generator
+        self.event = event
+        self.deadline = 0
+        self.done = False
+        self.result = None
+        self.error = None
+
+
+def _tick(kit: MotorKit, motions: list) -> Optional[int]:
+    # Advances every motion that is due, sending all of their updates together, and returns
+    # the earliest deadline of the motions that are still running.
+    now = time.monotonic_ns() + _TICK_NS
+    earliest = None
+    finished = False
+    with kit._batcher:
+        for motion in motions:
+            if motion.deadline <= now:
+                try:
+                    motion.deadline = next(motion.generator)
+                except StopIteration as stop:
+                    motion.done = True
+                    motion.result = stop.value
+                except Exception as error:
+                    motion.done = True
+                    motion.error = error
+                if motion.done:
+                    finished = True
+                    continue
+            if earliest is None or motion.deadline < earliest:
+                earliest = motion.deadline
+    if finished:
+        for motion in [motion for motion in motions if motion.done]:
+            motions.remove(motion)
+            if motion.event is not None:
+                motion.event.set()
+    return earliest
+
+
+class _Scheduler:
+    """Runs the motions of one kit on a single asyncio task, which exits when none are left."""
+
+    __slots__ = ("_kit", "_motions", "_task", "_wakeup")
+
+    def __init__(self, kit: MotorKit) -> None:
+        self._kit = kit
+        self._motions = []
+        self._task = None
+        self._wakeup = None
+
+    async def run(self, generator):
+        """Drives ``generator`` to completion along with the kit's other motions, and returns
+        its result."""
+        import asyncio
+
+        motion = _Motion(generator, asyncio.Event())
+        self._motions.append(motion)
+        if self._task is None:
+            # The event belongs to the running loop, so each scheduler task makes its own.
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._schedule())
+        else:
+            self._wakeup.set()
+        try:
+            await motion.event.wait()
+        finally:
+            if not motion.done:
+                self._motions.remove(motion)
+                generator.close()
+        if motion.error is not None:
+            raise motion.error
+        return motion.result
+
+    async def _schedule(self) -> None:
+        motions = self._motions
+        try:
+            await self._scheduling(motions, self._wakeup)
+        except BaseException as error:
+            # Nothing else would ever finish the waiting motions, so fail them all with the
+            # error. Only a cancellation is passed on, as the motions report anything else.
+            for motion in motions:
+                motion.done = True
+                motion.error = error
+                if motion.event is not None:
+                    motion.event.set()
+            motions.clear()
+            if not isinstance(error, Exception):
+                raise
+        finally:
+            self._task = None
+            self._wakeup = None
+
+    async def _scheduling(self, motions: list, wakeup: "asyncio.Event") -> None:
+        import asyncio
+
+        while motions:
+            wakeup.clear()
+            earliest = _tick(self._kit, motions)
+            if earliest is None:
+                continue
+            delay = earliest - time.monotonic_ns()
+            if delay <= 0:
+                await asyncio.sleep(0)
+                continue
+            try:
+                await asyncio.wait_for(wakeup.wait(), delay / 1_000_000_000)
+            except asyncio.TimeoutError:
+                pass
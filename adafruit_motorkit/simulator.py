@@ -0,0 +1,264 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_motorkit.simulator`
+====================================================
+
+A simulated I2C bus with PCA9685 register models, for using `adafruit_motorkit.MotorKit` without
+hardware. Every transaction is recorded with its time and size, so the bus traffic caused by
+motor commands can be measured and checked.
+
+.. code-block:: python
+
+    from adafruit_motorkit import MotorKit
+    from adafruit_motorkit.simulator import SimulatedI2C
+
+    i2c = SimulatedI2C()
+    kit = MotorKit(i2c=i2c)
+
+    kit.stepper1.onestep()
+    print(len(i2c.transactions), i2c.transactions[-1].size)
+    print(i2c.devices[0x60].duty_cycle(9))
+"""
+
+import time
+from collections import namedtuple
+
+try:
+    from typing import Optional, Sequence
+
+    from circuitpython_typing import ReadableBuffer, WriteableBuffer
+except ImportError:
+    pass
+
+_MODE1 = 0x00
+_ALLCALLADR = 0x05
+_LED0_ON_L = 0x06
+_LED15_OFF_H = 0x45
+_ALL_LED_ON_L = 0xFA
+_ALL_LED_OFF_H = 0xFD
+_PRE_SCALE = 0xFE
+
+_MODE1_ALLCALL = 0x01
+_MODE1_SLEEP = 0x10
+_MODE1_AI = 0x20
+_MODE1_RESTART = 0x80
+
+
+class Transaction(namedtuple("Transaction", ("time", "address", "written", "read"))):
+    """One I2C transaction: the `time.monotonic_ns` time it started, the address it was sent to,
+    the bytes written (including the register address) and the number of bytes read."""
+
+    __slots__ = ()
+
+    @property
+    def size(self) -> int:
+        """Bytes on the wire, including one address byte for each START."""
+        starts = 2 if self.written and self.read else 1
+        return starts + len(self.written) + self.read
+
+    def duration(self, frequency: int) -> int:
+        """Nanoseconds the transaction takes on a bus clocked at ``frequency`` Hertz: nine clocks
+        per byte (eight bits and the acknowledge) plus one for each START and the STOP."""
+        starts = 2 if self.written and self.read else 1
+        clocks = 9 * self.size + starts + 1
+        return clocks * 1_000_000_000 // frequency
+
+
+class SimulatedPCA9685:
+    """Register model of a PCA9685 as it is after power on.
+
+    Implements MODE1 sleep and auto-increment, the PRE_SCALE register (which can only be written
+    while asleep), the LEDn registers, the ALL_LED registers and the ALLCALL address.
+
+    :param int address: The I2C address of the PCA9685
+    """
+
+    def __init__(self, address: int) -> None:
+        self.address = address
+        self.registers = bytearray(256)
+        """The current value of every register."""
+        self.registers[_MODE1] = _MODE1_SLEEP | _MODE1_ALLCALL
+        self.registers[0x01] = 0x04
+        self.registers[0x02] = 0xE2
+        self.registers[0x03] = 0xE4
+        self.registers[0x04] = 0xE8
+        self.registers[_ALLCALLADR] = 0xE0
+        for channel in range(16):
+            self.registers[_LED0_ON_L + 4 * channel + 3] = 0x10
+        self.registers[_ALL_LED_OFF_H] = 0x10
+        self.registers[_PRE_SCALE] = 0x1E
+        self._pointer = 0
+
+    def answers(self, address: int) -> bool:
+        """Whether the chip responds to ``address``, either its own or the ALLCALL address."""
+        if address == self.address:
+            return True
+        mode1 = self.registers[_MODE1]
+        return bool(mode1 & _MODE1_ALLCALL) and address == self.registers[_ALLCALLADR] >> 1
+
+    def _advance(self) -> None:
+        if self.registers[_MODE1] & _MODE1_AI:
+            # The LED registers roll over to MODE1, everything else just increments.
+            self._pointer = 0 if self._pointer == _LED15_OFF_H else (self._pointer + 1) & 0xFF
+
+    def _store(self, register: int, value: int) -> None:
+        registers = self.registers
+        if register == _MODE1:
+            # Writing 1 to RESTART clears it.
+            registers[_MODE1] = value & ~_MODE1_RESTART
+        elif register == _PRE_SCALE:
+            if registers[_MODE1] & _MODE1_SLEEP:
+                registers[_PRE_SCALE] = max(value, 3)
+        elif _ALL_LED_ON_L <= register <= _ALL_LED_OFF_H:
+            # Each ALL_LED byte is loaded into the same byte of every channel.
+            for channel in range(16):
+                registers[_LED0_ON_L + 4 * channel + register - _ALL_LED_ON_L] = value
+        else:
+            registers[register] = value
+
+    def write(self, data: bytes) -> None:
+        """Handles the bytes of a write transaction. The first byte selects the register."""
+        if not data:
+            return
+        self._pointer = data[0]
+        for value in data[1:]:
+            self._store(self._pointer, value)
+            self._advance()
+
+    def read(self, count: int) -> bytes:
+        """Handles a read transaction of ``count`` bytes from the selected register."""
+        result = bytearray(count)
+        for i in range(count):
+            # The ALL_LED registers are write only.
+            pointer = self._pointer
+            result[i] = 0 if _ALL_LED_ON_L <= pointer <= _ALL_LED_OFF_H else self.registers[pointer]
+            self._advance()
+        return bytes(result)
+
+    def duty_cycle(self, channel: int) -> int:
+        """The 16 bit duty cycle a channel is outputting. Full off takes priority over full on,
+        as on the chip."""
+        offset = _LED0_ON_L + 4 * channel
+        registers = self.registers
+        if registers[offset + 3] & 0x10:
+            return 0x0000
+        if registers[offset + 1] & 0x10:
+            return 0xFFFF
+        on = registers[offset] | (registers[offset + 1] & 0x0F) << 8
+        off = registers[offset + 2] | (registers[offset + 3] & 0x0F) << 8
+        return ((off - on) & 0xFFF) << 4
+
+    @property
+    def frequency(self) -> float:
+        """The PWM frequency in Hertz set by PRE_SCALE, assuming the 25 MHz internal clock."""
+        return 25000000 / 4096 / (self.registers[_PRE_SCALE] + 1)
+
+
+class SimulatedI2C:
+    """A `busio.I2C` compatible bus with a `SimulatedPCA9685` at each address.
+
+    :param list addresses: Addresses of the simulated PCA9685s. Default is ``[0x60]``.
+    :param int frequency: If set, each transaction blocks for as long as it would take on a bus
+        clocked at this many Hertz, such as ``100000``, ``400000`` or ``1000000``. Default is
+        ``None``, which returns straight away.
+    """
+
+    def __init__(
+        self, addresses: Sequence[int] = (0x60,), *, frequency: Optional[int] = None
+    ) -> None:
+        self.devices = {address: SimulatedPCA9685(address) for address in addresses}
+        """The `SimulatedPCA9685` at each address."""
+        self.transactions = []
+        """Every `Transaction` on the bus, oldest first."""
+        self.frequency = frequency
+        """The modelled bus clock in Hertz, or ``None`` for no bus time."""
+        try:
+            import threading
+
+            self._lock = threading.Lock()
+        except ImportError:
+            self._lock = None
+        self._locked = False
+
+    def _targets(self, address: int) -> list:
+        targets = [device for device in self.devices.values() if device.answers(address)]
+        if not targets:
+            raise OSError(19, "No such device")
+        return targets
+
+    def _log(self, transaction: Transaction) -> None:
+        self.transactions.append(transaction)
+        if self.frequency:
+            # Spin rather than sleep, sleeps are far coarser than a transaction.
+            end = transaction.time + transaction.duration(self.frequency)
+            while time.monotonic_ns() < end:
+                pass
+
+    def try_lock(self) -> bool:
+        """Attempts to grab the bus lock. Returns True on success."""
+        if self._lock is not None:
+            return self._lock.acquire(False)
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self) -> None:
+        """Releases the bus lock."""
+        if self._lock is not None:
+            self._lock.release()
+        else:
+            self._locked = False
+
+    def scan(self) -> list:
+        """Lists the addresses of the simulated devices."""
+        return sorted(self.devices)
+
+    def writeto(
+        self, address: int, buffer: ReadableBuffer, *, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Writes ``buffer[start:end]`` to the device(s) at ``address``."""
+        data = bytes(buffer[start:end])
+        self._log(Transaction(time.monotonic_ns(), address, data, 0))
+        for device in self._targets(address):
+            device.write(data)
+
+    def readfrom_into(
+        self, address: int, buffer: WriteableBuffer, *, start: int = 0, end: Optional[int] = None
+    ) -> None:
+        """Reads into ``buffer[start:end]`` from the device at ``address``."""
+        end = len(buffer) if end is None else end
+        self._log(Transaction(time.monotonic_ns(), address, b"", end - start))
+        buffer[start:end] = self._targets(address)[0].read(end - start)
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        buffer_out: ReadableBuffer,
+        buffer_in: WriteableBuffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ) -> None:
+        """Writes ``buffer_out[out_start:out_end]`` and then, after a repeated start, reads into
+        ``buffer_in[in_start:in_end]``."""
+        data = bytes(buffer_out[out_start:out_end])
+        in_end = len(buffer_in) if in_end is None else in_end
+        self._log(Transaction(time.monotonic_ns(), address, data, in_end - in_start))
+        device = self._targets(address)[0]
+        device.write(data)
+        buffer_in[in_start:in_end] = device.read(in_end - in_start)
+
+    def deinit(self) -> None:
+        """Releases the bus. Does nothing for the simulated bus."""
+
+    def __enter__(self) -> "SimulatedI2C":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.deinit()
@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_motorkit.stack`
+====================================================
+
+Several `adafruit_motorkit.MotorKit` boards stacked on one I2C bus and driven as one.
+"""
+
+from micropython import const
+
+from adafruit_motorkit import MotorKit, _DCMotor, _StepperMotor
+
+try:
+    from types import TracebackType
+    from typing import Optional, Tuple, Type
+except ImportError:
+    pass
+
+_ALLCALLADR = const(0x05)
+_ALL_LED_OFF_H = const(0xFD)
+
+
+def _released(kit: MotorKit) -> None:
+    # Called with the kit's batch held after a broadcast write set the full off bit of every
+    # channel. The enable pins of the motors in use are turned back on; with both of their
+    # inputs off the motor outputs stay off.
+    regs = kit._regs
+    hardware = kit._hardware
+    for index in range(16):
+        offset = 4 * index + 1
+        if kit._known >> index & 1:
+            regs[offset : offset + 3] = hardware[offset : offset + 3]
+        regs[offset + 3] = hardware[offset + 3] = 0x10
+    kit._valid = 0xFFFF
+    kit._dirty = kit._joined = 0
+    for motor in kit._motors[:4]:
+        if motor:
+            motor._throttle = None
+    for index in range(16):
+        if kit._enabled >> index & 1:
+            kit._write(index, 0xFFFF)
+
+
+class _ArrayBatch:
+    """Context manager returned by `MotorKitArray.batch`."""
+
+    __slots__ = ("_kits",)
+
+    def __init__(self, kits: list) -> None:
+        self._kits = kits
+
+    def __enter__(self) -> "_ArrayBatch":
+        entered = []
+        try:
+            for kit in self._kits:
+                kit._batcher.__enter__()
+                entered.append(kit)
+        except BaseException:
+            for kit in reversed(entered):
+                kit._batcher.__exit__(None, None, None)
+            raise
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Type[type]],
+        exception_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        error = None
+        for kit in reversed(self._kits):
+            try:
+                kit._batcher.__exit__(exception_type, exception_value, traceback)
+            except Exception as exception:
+                error = exception
+        if error is not None:
+            raise error
+
+
+class MotorKitArray:
+    """Several kits stacked on one I2C bus, with their motors numbered across all of them. Motors
+    1 to 4 are on the first kit, 5 to 8 on the second and so on. Steppers 1 and 2 are on the first
+    kit, 3 and 4 on the second and so on.
+
+    Every kit also answers the PCA9685 ALLCALL address, so `stop` can switch off every motor on
+    every kit with a single I2C transaction.
+
+    :param list addresses: I2C addresses of the kits, in order. Default is ``[0x60]``.
+    :param busio.I2C i2c: I2C bus object to use. If not specified, use ``board.I2C()``.
+    :param int steppers_microsteps: Number of microsteps per step for stepper motors. Default is 16.
+    :param float pwm_frequency: defaults to 1600 Hz
+    :param bool thread_safe: Passed to each `MotorKit`. Defaults to ``False``.
+    :param int allcall_address: I2C address that every kit answers. Must not be the address of any
+      device on the bus. Default is ``0x70``, the PCA9685 default.
+
+    .. code-block:: python
+
+        from adafruit_motorkit.stack import MotorKitArray
+
+        kits = MotorKitArray([0x60, 0x61])
+
+        with kits.batch():
+            for number in range(1, 9):
+                kits.motor(number).throttle = 0.5
+
+        kits.stop()
+    """
+
+    __slots__ = ("_allcall", "_batcher", "kits")
+
+    def __init__(
+        self,
+        addresses: Tuple[int, ...] = (0x60,),
+        i2c: Optional["busio.I2C"] = None,
+        steppers_microsteps: int = 16,
+        pwm_frequency: float = 1600.0,
+        thread_safe: bool = False,
+        allcall_address: int = 0x70,
+    ) -> None:
+        from adafruit_bus_device.i2c_device import I2CDevice
+
+        if allcall_address in addresses:
+            raise ValueError("The ALLCALL address must not be the address of a kit")
+        if i2c is None:
+            import board
+
+            i2c = board.I2C()
+        self.kits = [
+            MotorKit(address, i2c, steppers_microsteps, pwm_frequency, thread_safe)
+            for address in addresses
+        ]
+        """The `MotorKit` for each address, in order."""
+        for kit in self.kits:
+            pca = kit._connect()
+            with pca.i2c_device as i2c_device:
+                i2c_device.write(bytes((_ALLCALLADR, allcall_address << 1)))
+            pca.mode1_reg |= 0x01
+        self._allcall = I2CDevice(i2c, allcall_address, probe=False)
+        self._batcher = _ArrayBatch(self.kits)
+
+    def motor(self, number: int) -> _DCMotor:
+        """The ``motorN`` of the kit that ``number`` falls on, counting from 1."""
+        if number < 1:
+            raise IndexError("Motor numbers start at 1")
+        return getattr(self.kits[(number - 1) // 4], "motor" + str((number - 1) % 4 + 1))
+
+    def stepper(self, number: int) -> _StepperMotor:
+        """The ``stepperN`` of the kit that ``number`` falls on, counting from 1."""
+        if number < 1:
+            raise IndexError("Stepper numbers start at 1")
+        return getattr(self.kits[(number - 1) // 2], "stepper" + str((number - 1) % 2 + 1))
+
+    def batch(self) -> _ArrayBatch:
+        """Context manager that batches the updates of every kit, as `MotorKit.batch` does. Each
+        kit's updates are sent to it in as few transactions as possible when the outermost
+        ``with`` block exits."""
+        return self._batcher
+
+    def stop(self) -> None:
+        """Switches every channel of every kit fully off with one broadcast I2C transaction of two
+        bytes, which sets the full off bit of every channel through the ALL_LED_OFF_H register. DC
+        motors coast with their throttle set to ``None`` and steppers are released. The motors can
+        be used again straight away."""
+        with self._batcher:
+            with self._allcall as i2c:
+                i2c.write(bytes((_ALL_LED_OFF_H, 0x10)))
+            for kit in self.kits:
+                if kit._trace is not None:
+                    kit._trace._record(_ALL_LED_OFF_H, b"\x10")
+                _released(kit)
@@ -0,0 +1,198 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_motorkit.stats`
+====================================================
+
+Counters and latency histograms for a `adafruit_motorkit.MotorKit`, returned by
+`adafruit_motorkit.MotorKit.stats` when the kit is created with ``stats=True``. They are cheap
+enough to leave on, and `KitStats.snapshot` returns them as plain values so they can be scraped
+periodically.
+
+.. code-block:: python
+
+    from adafruit_motorkit import MotorKit
+
+    kit = MotorKit(stats=True)
+
+    kit.stepper1.move(200, rate=400)
+    print(kit.stats.snapshot(reset=True))
+"""
+
+import array
+import time
+
+try:
+    from typing import Tuple
+
+    from adafruit_motorkit import MotorKit
+except ImportError:
+    pass
+
+LATENCY_BOUNDS = (10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000)
+"""Upper bounds, in microseconds, of the histogram buckets. A last bucket counts everything
+slower."""
+
+# Names of the kit's motors, in the order of MotorKit._motors.
+_NAMES = ("motor1", "motor2", "motor3", "motor4", "stepper1", "stepper2")
+
+
+class Histogram:
+    """Counts of latencies in the fixed buckets of `LATENCY_BOUNDS`."""
+
+    def __init__(self) -> None:
+        self.counts = array.array("L", [0] * (len(LATENCY_BOUNDS) + 1))
+        """Number of latencies in each bucket."""
+        self.count = 0
+        """Number of latencies recorded."""
+        self.total = 0
+        """Sum of the latencies recorded, in nanoseconds."""
+        self.max = 0
+        """The longest latency recorded, in nanoseconds."""
+
+    def record(self, nanoseconds: int) -> None:
+        """Adds one latency."""
+        microseconds = nanoseconds // 1000
+        bucket = 0
+        for bound in LATENCY_BOUNDS:
+            if microseconds < bound:
+                break
+            bucket += 1
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += nanoseconds
+        self.max = max(self.max, nanoseconds)
+
+    def snapshot(self) -> dict:
+        """The histogram as plain values, with times in microseconds."""
+        return {
+            "bounds_us": list(LATENCY_BOUNDS),
+            "counts": list(self.counts),
+            "count": self.count,
+            "mean_us": self.total / self.count / 1000 if self.count else 0.0,
+            "max_us": self.max / 1000,
+        }
+
+    def reset(self) -> None:
+        """Clears every count."""
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+
+class KitStats:
+    """Counters for one kit and each of its motors.
+
+    Writes are counted per channel: a DC throttle change writes two channels and a step writes
+    up to four. A write is suppressed when the channel already holds the value, so it is never
+    sent. Bytes count the I2C traffic, including the address and register bytes of each
+    transaction; a motor is charged for each byte of its channels that is sent, and the latency of
+    each transaction that sends any of them.
+
+    :param MotorKit kit: The kit being measured
+    """
+
+    def __init__(self, kit: MotorKit) -> None:
+        self._kit = kit
+        # The channels each motor drives, and the name of each stepper by its lowest coil channel.
+        wiring = kit._wiring
+        self._channels = tuple(wiring) + (wiring[0] + wiring[1], wiring[2] + wiring[3])
+        self._steppers = {wiring[0][1]: "stepper1", wiring[2][1]: "stepper2"}
+        self._writes = array.array("L", [0] * 16)
+        self._suppressed = array.array("L", [0] * 16)
+        self._sent = array.array("L", [0] * 16)
+        self.transactions = 0
+        """Number of I2C transactions sent to the channel registers."""
+        self.bytes = 0
+        """Number of bytes those transactions took on the bus."""
+        self.write_latency = Histogram()
+        """Time taken by each I2C transaction."""
+        self.motor_write_latency = {name: Histogram() for name in _NAMES}
+        """Time taken by each I2C transaction that sent a channel of each motor. A transaction
+        covering more than one motor is recorded once for each of them."""
+        # Each motor's channels as a mask, with the histogram its transactions are recorded in.
+        self._latencies = tuple(
+            (sum(1 << index for index in channels), self.motor_write_latency[name])
+            for name, channels in zip(_NAMES, self._channels)
+        )
+        self.steps = {"stepper1": 0, "stepper2": 0}
+        """Steps taken by each stepper."""
+        self.step_latency = {"stepper1": Histogram(), "stepper2": Histogram()}
+        """Time taken to make each step of each stepper, including its I2C write unless the step
+        was part of a batch."""
+
+    def _transaction(self, start: int, end: int, started: int) -> None:
+        # Records the write of the register image bytes start up to end, which began at started.
+        # Channel n is bytes 4 * n + 1 to 4 * n + 4 of the image.
+        latency = time.monotonic_ns() - started
+        self.write_latency.record(latency)
+        self.transactions += 1
+        self.bytes += 2 + end - start
+        sent = self._sent
+        for offset in range(start - 1, end - 1):
+            sent[offset >> 2] += 1
+        channels = (2 << ((end - 2) >> 2)) - (1 << ((start - 1) >> 2))
+        for mask, histogram in self._latencies:
+            if mask & channels:
+                histogram.record(latency)
+
+    def _step(self, channel: int, started: int) -> None:
+        name = self._steppers[channel]
+        self.steps[name] += 1
+        self.step_latency[name].record(time.monotonic_ns() - started)
+
+    def _motor(self, name: str, channels: Tuple[int, ...]) -> dict:
+        values = {
+            "writes": sum(self._writes[index] for index in channels),
+            "suppressed": sum(self._suppressed[index] for index in channels),
+            "bytes": sum(self._sent[index] for index in channels),
+            "write_latency": self.motor_write_latency[name].snapshot(),
+        }
+        if name in self.steps:
+            values["steps"] = self.steps[name]
+            values["step_latency"] = self.step_latency[name].snapshot()
+        return values
+
+    def snapshot(self, reset: bool = False) -> dict:
+        """Returns every counter as plain values: totals for the kit, and a ``"motors"`` entry
+        for each motor or stepper the kit has created.
+
+        :param bool reset: Also reset the counters, without losing any update in between
+        """
+        kit = self._kit
+        with kit._batcher:
+            values = {
+                "transactions": self.transactions,
+                "bytes": self.bytes,
+                "writes": sum(self._writes),
+                "suppressed": sum(self._suppressed),
+                "steps": sum(self.steps.values()),
+                "write_latency": self.write_latency.snapshot(),
+                "motors": {
+                    name: self._motor(name, channels)
+                    for name, channels, motor in zip(_NAMES, self._channels, kit._motors)
+                    if motor
+                },
+            }
+            if reset:
+                self.reset()
+        return values
+
+    def reset(self) -> None:
+        """Sets every counter back to zero."""
+        with self._kit._batcher:
+            for counters in (self._writes, self._suppressed, self._sent):
+                for i in range(16):
+                    counters[i] = 0
+            self.transactions = 0
+            self.bytes = 0
+            self.write_latency.reset()
+            for histogram in self.motor_write_latency.values():
+                histogram.reset()
+            for name in self.steps:
+                self.steps[name] = 0
+                self.step_latency[name].reset()
@@ -0,0 +1,302 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_motorkit.trace`
+====================================================
+
+Records every channel write the motors of a `adafruit_motorkit.MotorKit` make, and every transaction
+it sends to its PCA9685, into a compact binary file, started by `adafruit_motorkit.MotorKit.trace`,
+and analyzes or replays the recordings. The analysis reports writes per second for each motor,
+redundant writes that repeat the value a channel already holds, which the kit does not send,
+separate transactions close enough together that they could have been one auto-increment write, and
+how busy the bus was over time. Replaying a recording into a simulated PCA9685 gives the register
+state it leaves behind, for regression checks. Only for use on Raspberry Pi or other SBC.
+
+.. code-block:: python
+
+    from adafruit_motorkit import MotorKit
+
+    kit = MotorKit()
+
+    with kit.trace("run.trace"):
+        kit.stepper1.move(200, rate=400)
+
+.. code-block:: shell
+
+    python -m adafruit_motorkit.trace analyze run.trace --frequency 400000
+    python -m adafruit_motorkit.trace replay run.trace
+
+A recording is a header, ``<4sBBd12B>``: ``b"MKTR"``, the format version, the kit's address, the
+`time.time` the recording started and the channels of the kit's wiring. Each record follows as
+``<QBBBB>``: nanoseconds since the start, the kind of record and three values. A transaction, kind
+0, has a bit for each of ``motor1`` to ``motor4``, ``stepper1`` and ``stepper2`` that was in use,
+the first register and the number of bytes, and is followed by the bytes written. A channel write,
+kind 1, has the motor that made it (0 to 5 for ``motor1`` to ``stepper2``, or 6 for the kit
+itself), the channel, and 1 if it was redundant and not sent.
+"""
+
+import argparse
+import json
+import struct
+import sys
+import time
+from collections import namedtuple
+
+from adafruit_motorkit.simulator import SimulatedI2C, Transaction
+
+try:
+    from typing import Any, List, Optional, Tuple
+
+    from adafruit_motorkit import MotorKit
+except ImportError:
+    pass
+
+_MAGIC = b"MKTR"
+_VERSION = 2
+_HEADER = struct.Struct("<4sBBd12B")
+_RECORD = struct.Struct("<QBBBB")
+_TRANSACTION = 0
+_WRITE = 1
+_LED0_ON_L = 0x06
+_ALL_LED_OFF_H = 0xFD
+_NAMES = ("motor1", "motor2", "motor3", "motor4", "stepper1", "stepper2", "kit")
+
+Record = namedtuple("Record", ("time", "motors", "register", "data"))
+"""One recorded transaction: nanoseconds since the start of the recording, the bits of the motors
+in use, the first register written and the bytes written to it."""
+
+Write = namedtuple("Write", ("time", "motor", "channel", "suppressed"))
+"""One recorded channel write: nanoseconds since the start of the recording, the name of the motor
+that made it, or ``"kit"``, the channel, and whether it was redundant, repeating the value the
+channel already held, and so was not sent."""
+
+
+class Tracer:
+    """Records the channel writes and I2C transactions of a kit until closed. Returned by
+    `adafruit_motorkit.MotorKit.trace`, and also a context manager that closes it on exit.
+
+    :param MotorKit kit: The kit to record
+    :param str path: The file to record to, replacing any file already there
+    """
+
+    def __init__(self, kit: MotorKit, path: str) -> None:
+        if kit._trace is not None:
+            raise RuntimeError("The kit is already being traced")
+        self._kit = kit
+        self._file = open(path, "wb")
+        wiring = [channel for terminal in kit._wiring for channel in terminal]
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, kit._address, time.time(), *wiring))
+        self._start = time.monotonic_ns()
+        kit._trace = self
+
+    def _record(self, register: int, data: bytes) -> None:
+        motors = 0
+        for index, motor in enumerate(self._kit._motors):
+            if motor:
+                motors |= 1 << index
+        header = _RECORD.pack(
+            time.monotonic_ns() - self._start, _TRANSACTION, motors, register, len(data)
+        )
+        self._file.write(header + data)
+
+    def _write(self, motor: Any, channel: int, suppressed: bool) -> None:
+        index = 6
+        if motor is not None:
+            for i, used in enumerate(self._kit._motors):
+                if used is motor:
+                    index = i
+        self._file.write(
+            _RECORD.pack(time.monotonic_ns() - self._start, _WRITE, index, channel, suppressed)
+        )
+
+    def close(self) -> None:
+        """Stops recording and closes the file."""
+        if self._kit._trace is self:
+            with self._kit._batcher:
+                self._kit._trace = None
+        self._file.close()
+
+    def __enter__(self) -> "Tracer":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def load(path: str) -> Tuple[dict, list]:
+    """Reads a recording, returning its header values and a list of its `Record` and `Write`
+    entries, in the order they were made.
+
+    :param str path: The recording
+    """
+    with open(path, "rb") as file:
+        header = file.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[:4] != _MAGIC:
+            raise ValueError(f"{path} is not a motor kit trace")
+        magic, version, address, started, *wiring = _HEADER.unpack(header)
+        if version != _VERSION:
+            raise ValueError(f"Unsupported trace version {version}")
+        records = []
+        while True:
+            fields = file.read(_RECORD.size)
+            if len(fields) < _RECORD.size:
+                break
+            nanoseconds, kind, first, second, third = _RECORD.unpack(fields)
+            if kind == _WRITE:
+                records.append(Write(nanoseconds, _NAMES[first], second, bool(third)))
+            else:
+                records.append(Record(nanoseconds, first, second, file.read(third)))
+    info = {
+        "address": address,
+        "started": started,
+        "wiring": tuple(tuple(wiring[i : i + 3]) for i in range(0, 12, 3)),
+    }
+    return info, records
+
+
+class _Analysis:
+    """Running totals of `analyze`."""
+
+    def __init__(self, info: dict, frequency: int, interval: float, window: float) -> None:
+        self._info = info
+        self._frequency = frequency
+        self._interval = interval
+        self._window = window * 1e9
+        # The time and register byte range of the last transaction, if it could merge with the
+        # next.
+        self._previous = None
+        self._buckets = {}
+        self.motors = {}
+        self.totals = {"transactions": 0, "bytes": 0, "writes": 0, "redundant_writes": 0}
+        self.mergeable = {"transactions": 0, "bytes_saved": 0}
+        self.end = 0
+
+    def add(self, record: Any) -> None:
+        """Counts one channel write or transaction."""
+        self.end = record.time
+        if isinstance(record, Write):
+            counts = self.motors.setdefault(record.motor, {"writes": 0, "redundant": 0})
+            counts["writes"] += 1
+            self.totals["writes"] += 1
+            if record.suppressed:
+                counts["redundant"] += 1
+                self.totals["redundant_writes"] += 1
+            return
+        written = bytes((record.register,)) + record.data
+        transaction = Transaction(record.time, self._info["address"], written, 0)
+        self.totals["transactions"] += 1
+        self.totals["bytes"] += transaction.size
+        bucket = self._buckets.setdefault(int(record.time / 1e9 // self._interval), [0, 0])
+        bucket[0] += transaction.size
+        bucket[1] += transaction.duration(self._frequency)
+        if record.register == _ALL_LED_OFF_H:
+            self._previous = None
+            return
+        start = record.register - _LED0_ON_L
+        end = start + len(record.data)
+        previous = self._previous
+        if (
+            previous is not None
+            and record.time - previous[0] <= self._window
+            and (end <= previous[1] or start >= previous[2])
+        ):
+            # Writes to different registers in quick succession. Two writes cost two address and
+            # register bytes each; one write also resends whatever lies between them.
+            separate = 4 + end - start + previous[2] - previous[1]
+            saving = separate - (2 + max(end, previous[2]) - min(start, previous[1]))
+            if saving > 0:
+                self.mergeable["transactions"] += 1
+                self.mergeable["bytes_saved"] += saving
+        self._previous = (record.time, start, end)
+
+    def results(self) -> dict:
+        """The totals as plain values."""
+        seconds = self.end / 1e9
+        for counts in self.motors.values():
+            counts["writes_per_second"] = counts["writes"] / seconds if seconds else 0.0
+        interval = self._interval
+        results = {"duration_s": seconds}
+        results.update(self.totals)
+        results["motors"] = self.motors
+        results["mergeable"] = self.mergeable
+        results["utilization"] = [
+            {"time_s": index * interval, "bytes": size, "utilization": busy / (interval * 1e9)}
+            for index, (size, busy) in sorted(self._buckets.items())
+        ]
+        return results
+
+
+def analyze(
+    path: str, frequency: int = 100_000, interval: float = 1.0, window: float = 0.001
+) -> dict:
+    """Analyzes a recording and returns the results: its duration, the transactions and bytes in it,
+    the channel writes made and how many of them were redundant, repeating the value the channel
+    already held, the writes, redundant writes and writes per second of each motor, the transactions
+    that could have been merged into the one before and the bytes that would save, and the bytes
+    sent and fraction of time the bus was busy in each ``interval``.
+
+    :param str path: The recording
+    :param int frequency: The bus clock in Hertz, for working out how busy the bus was
+    :param float interval: Seconds covered by each entry of the utilization. A utilization above
+      1 means the writes could not have been sent that quickly at ``frequency``.
+    :param float window: Seconds within which two transactions count as mergeable
+    """
+    info, records = load(path)
+    analysis = _Analysis(info, frequency, interval, window)
+    for record in records:
+        analysis.add(record)
+    return analysis.results()
+
+
+def replay(path: str, i2c: Optional[SimulatedI2C] = None) -> SimulatedI2C:
+    """Sends every transaction of a recording to a simulated bus, without waiting between them,
+    and returns the bus. Auto-increment is turned on first, as the kit does when it sets up the
+    PCA9685.
+
+    :param str path: The recording
+    :param SimulatedI2C i2c: The bus to replay on. Default is a new one with a PCA9685 at the
+      recorded address.
+    """
+    info, records = load(path)
+    address = info["address"]
+    if i2c is None:
+        i2c = SimulatedI2C((address,))
+    i2c.writeto(address, bytes((0x00, 0x20)))
+    for record in records:
+        if isinstance(record, Write):
+            continue
+        i2c.writeto(address, bytes((record.register,)) + record.data)
+    return i2c
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Analyzes or replays a recording from the command line, printing the results as JSON."""
+    parser = argparse.ArgumentParser(prog="python -m adafruit_motorkit.trace")
+    commands = parser.add_subparsers(dest="command", required=True)
+    analyzing = commands.add_parser("analyze", help="report bus use and wasted writes")
+    analyzing.add_argument("path")
+    analyzing.add_argument("--frequency", type=int, default=100_000, help="bus clock in Hz")
+    analyzing.add_argument("--interval", type=float, default=1.0, help="seconds per bucket")
+    analyzing.add_argument(
+        "--window", type=float, default=0.001, help="seconds within which writes could merge"
+    )
+    replaying = commands.add_parser("replay", help="print the duty cycles a recording leaves")
+    replaying.add_argument("path")
+    args = parser.parse_args(argv)
+    if args.command == "analyze":
+        results = analyze(args.path, args.frequency, args.interval, args.window)
+    else:
+        i2c = replay(args.path)
+        device = next(iter(i2c.devices.values()))
+        results = {
+            "transactions": len(i2c.transactions) - 1,
+            "duty_cycles": [device.duty_cycle(channel) for channel in range(16)],
+        }
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
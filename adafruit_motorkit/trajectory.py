@@ -0,0 +1,260 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_motorkit.trajectory`
+====================================================
+
+Compiles stepper trajectories, given as positions sampled at times, into step events and PCA9685
+register frames with NumPy, so that running them on a `adafruit_motorkit.MotorKit` does nothing
+but send frames when they are due. A job of 100,000 steps compiles in about ten milliseconds.
+Needs NumPy. Only for use on Raspberry Pi or other SBC.
+
+.. code-block:: python
+
+    import numpy as np
+    from adafruit_motorkit import MotorKit
+    from adafruit_motorkit.trajectory import compile_trajectory
+
+    kit = MotorKit()
+
+    # stepper1 turns 1000 steps and back while stepper2 follows a sine wave, over ten seconds.
+    times = np.linspace(0, 10, 1001)
+    trajectory = compile_trajectory(
+        times,
+        stepper1=1000 * np.sin(np.pi * times / 10),
+        stepper2=200 * np.sin(2 * np.pi * times / 10),
+    )
+    trajectory.run(kit)
+"""
+
+import time
+
+import numpy as np
+
+from adafruit_motorkit import _INTERLEAVE, _MICROSTEP, _SINGLE, _step_frames
+
+try:
+    from typing import Optional, Sequence, Tuple
+
+    from adafruit_motorkit import MotorKit
+except ImportError:
+    pass
+
+
+def _events(times: np.ndarray, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Returns the time of each step of a piecewise linear path and the position after it, in
+    # steps from the start. A step is taken whenever the path crosses halfway between two steps.
+    rounded = np.rint(positions).astype(np.int64)
+    deltas = np.diff(rounded)
+    counts = np.abs(deltas)
+    total = int(counts.sum())
+    if not total:
+        return np.empty(0), np.empty(0, np.int64)
+    # Within a segment both are linear in the step's overall index, so only the coefficients are
+    # worked out per segment and then repeated for each of its steps.
+    direction = np.sign(deltas)
+    first = np.cumsum(counts) - counts
+    moving = counts > 0
+    slope = np.zeros(len(counts))
+    slope[moving] = np.diff(times)[moving] / np.diff(positions)[moving]
+    per_step = direction * slope
+    level = rounded[:-1] + 0.5 * direction - first * direction
+    index = np.arange(total)
+    return (
+        np.repeat(times[:-1] + (level - positions[:-1]) * slope, counts)
+        + index * np.repeat(per_step, counts),
+        np.repeat(rounded[:-1] + direction * (1 - first) - rounded[0], counts)
+        + index * np.repeat(direction, counts),
+    )
+
+
+class Trajectory:
+    """A compiled trajectory for ``stepper1`` and ``stepper2``, returned by `compile_trajectory`.
+
+    Each event is a time at which one or both steppers step. Positions are in microsteps from
+    wherever each stepper is when the trajectory is run.
+    """
+
+    def __init__(
+        self,
+        times: np.ndarray,
+        positions: np.ndarray,
+        changed: np.ndarray,
+        microsteps: int,
+        microstepping: bool,
+    ) -> None:
+        self.times = times
+        """Time of each event in nanoseconds from the start, as an ``int64`` array."""
+        self.positions = positions
+        """Position of each stepper after each event, in microsteps, as an ``(events, 2)``
+        ``int64`` array."""
+        self.changed = changed
+        """Whether each stepper steps at each event, as an ``(events, 2)`` boolean array."""
+        self.microsteps = microsteps
+        """The ``steppers_microsteps`` of the kit the trajectory was compiled for."""
+        self.microstepping = microstepping
+        """Whether the coils are microstepped, which is the case for the ``MICROSTEP`` style."""
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def duration(self) -> float:
+        """Seconds from the start to the last event."""
+        return float(self.times[-1]) / 1_000_000_000 if len(self.times) else 0.0
+
+    @property
+    def steps(self) -> Tuple[int, int]:
+        """Number of steps each stepper takes."""
+        return tuple(int(count) for count in self.changed.sum(axis=0))
+
+    def frames(self, stepper: int, start: int = 0) -> np.ndarray:
+        """Returns the register frames of one stepper for the events at which it steps, as an
+        ``(steps, 16)`` ``uint8`` array: the LEDn registers of its four coil channels.
+
+        :param int stepper: 1 or 2
+        :param int start: The stepper's microstep position when the trajectory starts
+        """
+        column = stepper - 1
+        table = np.frombuffer(_step_frames(self.microsteps, self.microstepping), np.uint8)
+        positions = self.positions[self.changed[:, column], column]
+        return table.reshape(-1, 16)[(start + positions) % (4 * self.microsteps)]
+
+    def run(self, kit: MotorKit) -> Tuple[int, int]:
+        """Runs the trajectory on ``kit``, returning when it is done. Returns the final position
+        of each stepper, in microsteps, as from `adafruit_motor.stepper.StepperMotor.onestep`, or
+        ``None`` for a stepper that does not move and so is not used.
+
+        :param MotorKit kit: The kit to run on. Its ``steppers_microsteps`` must be the same as
+          the trajectory was compiled for.
+        """
+        return kit._run(self._run(kit))
+
+    async def run_async(self, kit: MotorKit) -> Tuple[int, int]:
+        """Same as `run` but without blocking the event loop. Runs alongside moves and ramps
+        started with the kit's other ``_async`` methods."""
+        return await kit._run_async(self._run(kit))
+
+    def _run(self, kit: MotorKit):
+        if kit._steppers_microsteps != self.microsteps:
+            raise ValueError("The kit's steppers_microsteps differ from the trajectory's")
+        steppers = []
+        lanes = []
+        # Only the steppers that move are created, so the other terminals can drive DC motors.
+        for column, name in enumerate(("stepper1", "stepper2")):
+            if not self.changed[:, column].any():
+                continue
+            stepper = getattr(kit, name)
+            start = stepper._current_microstep
+            positions = start + self.positions[:, column]
+            # The offset of each event's frame in the frame table, or -1 when it does not step.
+            offsets = np.where(self.changed[:, column], positions % (4 * self.microsteps) * 16, -1)
+            steppers.append(stepper)
+            lanes.append((offsets.tolist(), positions.tolist()))
+        if not steppers:
+            return None, None
+        frames = _step_frames(self.microsteps, self.microstepping)
+        channels = [stepper._channel for stepper in steppers]
+        write_frame = kit._write_frame
+        batcher = kit._batcher
+        stats = kit._stats
+        deadlines = (self.times + time.monotonic_ns()).tolist()
+        for event, deadline in enumerate(deadlines):
+            yield deadline
+            if stats is not None:
+                started = time.monotonic_ns()
+            with batcher:
+                for stepper, channel, (offsets, positions) in zip(steppers, channels, lanes):
+                    offset = offsets[event]
+                    if offset >= 0:
+                        write_frame(channel, frames[offset : offset + 16], stepper)
+                        stepper._current_microstep = positions[event]
+            if stats is not None:
+                for channel, (offsets, _) in zip(channels, lanes):
+                    if offsets[event] >= 0:
+                        stats._step(channel, started)
+        return tuple(
+            getattr(kit, name)._current_microstep if self.changed[:, column].any() else None
+            for column, name in enumerate(("stepper1", "stepper2"))
+        )
+
+
+def compile_trajectory(
+    times: Sequence[float],
+    stepper1: Optional[Sequence[float]] = None,
+    stepper2: Optional[Sequence[float]] = None,
+    *,
+    style: int = _SINGLE,
+    microsteps: int = 16,
+    resolution: float = 0.0005,
+) -> Trajectory:
+    """Compiles the paths of ``stepper1`` and ``stepper2`` into a `Trajectory`.
+
+    Each path is the stepper's position in steps of ``style`` at each of ``times``, and moves in
+    a straight line between them. A step is taken when the path passes halfway to the next step,
+    so a stepper follows its path to the nearest step. Positions are relative to where the
+    stepper is when the trajectory is run, and the first one is normally 0. ``SINGLE`` and
+    ``DOUBLE`` keep whichever of the two patterns the stepper is in, so make one `onestep` in the
+    style first if it might not be.
+
+    Step times are rounded to ``resolution``, and steps of the two steppers that fall on the same
+    time are sent together.
+
+    :param times: Increasing times in seconds, from the start of the trajectory
+    :param stepper1: Positions of ``stepper1`` at each time, or ``None`` to leave it still
+    :param stepper2: Positions of ``stepper2`` at each time, or ``None`` to leave it still
+    :param int style: ``SINGLE``, ``DOUBLE``, ``INTERLEAVE`` or ``MICROSTEP``
+    :param int microsteps: The ``steppers_microsteps`` of the kit it will run on. Default is 16.
+    :param float resolution: Seconds to round step times to. A stepper cannot take more than one
+      step in this time. Default is 0.0005.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    if times.ndim != 1 or len(times) < 1:
+        raise ValueError("Times must be a one dimensional sequence")
+    if np.any(np.diff(times) <= 0):
+        raise ValueError("Times must be increasing")
+    if style == _MICROSTEP:
+        step_size = 1
+    elif style == _INTERLEAVE:
+        step_size = microsteps // 2
+    else:
+        step_size = microsteps
+    slots = []
+    steps = []
+    for given in (stepper1, stepper2):
+        path = np.zeros(len(times)) if given is None else np.asarray(given, np.float64)
+        if path.shape != times.shape:
+            raise ValueError("Each stepper needs one position for each time")
+        step_times, after = _events(times - times[0], path)
+        slot = np.rint(step_times / resolution).astype(np.int64)
+        if np.any(np.diff(slot) == 0):
+            raise ValueError("A stepper is faster than one step every resolution")
+        slots.append(slot)
+        steps.append(after * step_size)
+    # Both are sorted already, which a stable sort merges quickly. Steps of the two steppers in
+    # the same slot become one event.
+    merged = np.concatenate(slots)
+    order = np.argsort(merged, kind="stable")
+    merged = merged[order]
+    new = np.ones(len(merged), bool)
+    new[1:] = merged[1:] != merged[:-1]
+    rank = np.empty(len(merged), np.int64)
+    rank[order] = np.cumsum(new) - 1
+    events = merged[new]
+    positions = np.zeros((len(events), 2), np.int64)
+    changed = np.zeros((len(events), 2), bool)
+    for column, (event, after) in enumerate(zip(np.split(rank, [len(slots[0])]), steps)):
+        changed[event, column] = True
+        # Carries each position forward to the events at which the stepper does not step.
+        last = np.zeros(len(events), np.int64)
+        last[event] = np.arange(1, len(event) + 1)
+        positions[:, column] = np.concatenate(([0], after))[np.maximum.accumulate(last)]
+    return Trajectory(
+        np.rint(events * resolution * 1_000_000_000).astype(np.int64),
+        positions,
+        changed,
+        microsteps,
+        style == _MICROSTEP,
+    )
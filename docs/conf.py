@@ -25,7 +25,7 @@ extensions = [
 # Uncomment the below if you use native CircuitPython modules such as
 # digitalio, micropython and busio. List the modules you use. Without it, the
 # autodoc module docs will fail to generate with a warning.
-autodoc_mock_imports = ["pwmio"]
+autodoc_mock_imports = ["pwmio", "numpy"]
 
 
 intersphinx_mapping = {
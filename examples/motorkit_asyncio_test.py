@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""Move stepper 1 and ramp DC motor 3 at the same time from one asyncio event loop."""
+
+import asyncio
+
+import board
+from adafruit_motor import stepper
+
+from adafruit_motorkit import MotorKit
+
+kit = MotorKit(i2c=board.I2C())
+
+
+async def move_stepper():
+    while True:
+        await kit.stepper1.move_async(200, direction=stepper.FORWARD, rate=200)
+        await kit.stepper1.move_async(200, direction=stepper.BACKWARD, rate=200)
+
+
+async def ramp_motor():
+    while True:
+        await kit.motor3.ramp_async(1.0, 2)
+        await kit.motor3.ramp_async(-1.0, 4)
+        await kit.motor3.ramp_async(0, 2)
+
+
+async def main():
+    # Updates that are due at the same time are sent to the PCA9685 together.
+    await asyncio.gather(move_stepper(), ramp_motor())
+
+
+asyncio.run(main())
@@ -7,7 +7,6 @@
 #
 import atexit
 import random
-import threading
 import time
 
 import board
@@ -18,13 +17,10 @@ from adafruit_motorkit import MotorKit
 # create a default object, no changes to I2C address or frequency
 kit = MotorKit(i2c=board.I2C())
 
-# create empty threads (these will hold the stepper 1 and 2 threads)
-st1 = threading.Thread()
-st2 = threading.Thread()
-
 
 # recommended for auto-disabling motors on shutdown!
 def turnOffMotors():
+    kit.engine.stop()
     kit.stepper1.release()
     kit.stepper2.release()
 
@@ -33,58 +29,23 @@ atexit.register(turnOffMotors)
 
 stepstyles = [STEPPER.SINGLE, STEPPER.DOUBLE, STEPPER.INTERLEAVE, STEPPER.MICROSTEP]
 
-
-def stepper_worker(stepper, numsteps, direction, style):
-    # print("Steppin!")
-    for _ in range(numsteps):
-        stepper.onestep(direction=direction, style=style)
-    # print("Done")
-
+# The motion engine runs both steppers from one background thread, so steps that are due at the
+# same time are sent together and neither stepper's timing depends on the other.
+moves = {kit.stepper1: None, kit.stepper2: None}
 
 while True:
-    if not st1.is_alive():
-        randomdir = random.randint(0, 1)
-        print("Stepper 1")
-        if randomdir == 0:
-            move_dir = STEPPER.FORWARD
-            print("forward")
-        else:
-            move_dir = STEPPER.BACKWARD
-            print("backward")
-        randomsteps = random.randint(10, 50)
-        print(f"{randomsteps} steps")
-        st1 = threading.Thread(
-            target=stepper_worker,
-            args=(
-                kit.stepper1,
-                randomsteps,
-                move_dir,
-                stepstyles[random.randint(0, 3)],
-            ),
-        )
-        st1.start()
-
-    if not st2.is_alive():
-        print("Stepper 2")
-        randomdir = random.randint(0, 1)
-        if randomdir == 0:
-            move_dir = STEPPER.FORWARD
-            print("forward")
-        else:
-            move_dir = STEPPER.BACKWARD
-            print("backward")
-        randomsteps = random.randint(10, 50)
-        print(f"{randomsteps} steps")
-        st2 = threading.Thread(
-            target=stepper_worker,
-            args=(
-                kit.stepper2,
-                randomsteps,
-                move_dir,
-                stepstyles[random.randint(0, 3)],
-            ),
-        )
-        st2.start()
-
-    time.sleep(0.1)  # Small delay to stop from constantly polling threads
-    # see: https://forums.adafruit.com/viewtopic.php?f=50&t=104354&p=562733#p562733
+    for number, stepper in enumerate(moves, 1):
+        if moves[stepper] is None or moves[stepper].done:
+            print(f"Stepper {number}")
+            randomsteps = random.randint(10, 50)
+            if random.randint(0, 1) == 1:
+                randomsteps = -randomsteps
+                print("backward")
+            else:
+                print("forward")
+            print(f"{abs(randomsteps)} steps")
+            moves[stepper] = kit.engine.move(
+                stepper, randomsteps, style=stepstyles[random.randint(0, 3)], rate=100
+            )
+
+    time.sleep(0.1)  # Small delay to stop from constantly polling the moves
@@ -21,6 +21,7 @@ import time
 import board
 
 from adafruit_motorkit import MotorKit
+from adafruit_motorkit.drive import DifferentialDrive
 
 kit = MotorKit(i2c=board.I2C())
 
@@ -40,87 +41,60 @@ class Robot:
 
         self._left_trim = left_trim
         self._right_trim = right_trim
+        # Both wheels are updated together, in one write. The trims are applied here rather than
+        # by DifferentialDrive, which adds them in the direction each wheel turns, so that they
+        # are always added to the speed as before.
+        self._drive = DifferentialDrive(kit, "motor1", "motor2")
         if stop_at_exit:
             atexit.register(self.stop)
 
-    def _left_speed(self, speed):
-        """Set the speed of the left motor, taking into account its trim offset."""
-        assert -1 <= speed <= 1, "Speed must be a value between -1 to 1 inclusive!"
-        speed += self._left_trim
-        speed = max(-1, min(1, speed))  # Constrain speed to 0-255 after trimming.
-        kit.motor1.throttle = speed
-
-    def _right_speed(self, speed):
-        """Set the speed of the right motor, taking into account its trim offset."""
-        assert -1 <= speed <= 1, "Speed must be a value between -1 to 1 inclusive!"
-        speed += self._right_trim
-        speed = max(-1, min(1, speed))  # Constrain speed to 0-255 after trimming.
-        kit.motor2.throttle = speed
-
-    @staticmethod
-    def stop():
+    def stop(self):
         """Stop all movement."""
-        kit.motor1.throttle = 0
-        kit.motor2.throttle = 0
+        self._drive.stop()
+
+    def _move(self, left, right, seconds):
+        # Set the speed of both motors, taking into account their trim offsets.
+        assert -1 <= left <= 1, "Speed must be a value between -1 to 1 inclusive!"
+        assert -1 <= right <= 1, "Speed must be a value between -1 to 1 inclusive!"
+        left = max(-1, min(1, left + self._left_trim))  # Constrain speed to -1 to 1 after trimming.
+        right = max(-1, min(1, right + self._right_trim))
+        self._drive.set_wheels(left, right)
+        # If an amount of time is specified, move for that time and then stop.
+        if seconds is not None:
+            time.sleep(seconds)
+            self.stop()
 
     def forward(self, speed, seconds=None):
-        """Move forward at the specified speed (0-255).  Will start moving
+        """Move forward at the specified speed (0-1).  Will start moving
         forward and return unless a seconds value is specified, in which
         case the robot will move forward for that amount of time and then stop.
         """
-        # Set motor speed and move both forward.
-        self._left_speed(speed)
-        self._right_speed(speed)
-        # If an amount of time is specified, move for that time and then stop.
-        if seconds is not None:
-            time.sleep(seconds)
-            self.stop()
+        self._move(speed, speed, seconds)
 
     def steer(self, speed, direction):
         # Move forward at the specified speed (0- 1).  Direction is +- 1.
         # Full left is -1, Full right is +1
         if (speed + direction / 2) > 1:
             speed -= direction / 2  # calibrate so total motor output never goes above 1
-        left = speed + direction / 2
-        right = speed - direction / 2
-        self._left_speed(left)
-        self._right_speed(right)
+        self._move(speed + direction / 2, speed - direction / 2, None)
 
     def backward(self, speed, seconds=None):
-        """Move backward at the specified speed (0-255).  Will start moving
+        """Move backward at the specified speed (0-1).  Will start moving
         backward and return unless a seconds value is specified, in which
         case the robot will move backward for that amount of time and then stop.
         """
-        # Set motor speed and move both backward.
-        self._left_speed(-1 * speed)
-        self._right_speed(-1 * speed)
-        # If an amount of time is specified, move for that time and then stop.
-        if seconds is not None:
-            time.sleep(seconds)
-            self.stop()
+        self._move(-speed, -speed, seconds)
 
     def right(self, speed, seconds=None):
         """Spin to the right at the specified speed.  Will start spinning and
         return unless a seconds value is specified, in which case the robot will
         spin for that amount of time and then stop.
         """
-        # Set motor speed and move both forward.
-        self._left_speed(speed)
-        self._right_speed(0)
-        # If an amount of time is specified, move for that time and then stop.
-        if seconds is not None:
-            time.sleep(seconds)
-            self.stop()
+        self._move(speed, 0, seconds)
 
     def left(self, speed, seconds=None):
         """Spin to the left at the specified speed.  Will start spinning and
         return unless a seconds value is specified, in which case the robot will
         spin for that amount of time and then stop.
         """
-        # Set motor speed and move both forward.
-        self._left_speed(0)
-        self._right_speed(speed)
-        # If an amount of time is specified, move for that time and then stop.
-        if seconds is not None:
-            time.sleep(seconds)
-            self.stop()
+        self._move(0, speed, seconds)